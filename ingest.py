@@ -1,10 +1,10 @@
 import os
 import contextlib
+import hashlib
 import logging
 import argparse
 import pandas as pd
-from datetime import datetime
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session
 from src.model import (
     Volume,
@@ -44,6 +44,12 @@ def parse_arguments():
     parser = argparse.ArgumentParser(description="Ingest data into the database.")
     parser.add_argument("data_dir", help="Path to the data directory")
     parser.add_argument("-o", "--out", help="Output database file path")
+    parser.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        help="Reingest data even if source files are unchanged",
+    )
     return parser.parse_args()
 
 
@@ -67,22 +73,20 @@ def get_file_paths(base_path):
     return volumes_file, income_stmt_path, hours_path, historical_hours_file
 
 
-def sanity_check_data_dir(base_path, volumes_file, income_stmt_path, hours_path):
+def sanity_check_data_dir(base_path, volumes_file, income_stmt_files, hours_files):
     """
-    Sanity checks for data directory
+    Sanity checks for data directory, given the data file lists already discovered
+    by find_data_files() so the directories aren't rescanned just to count files
     """
     error = None
     if not os.path.isdir(base_path):
         error = f"ERROR: data directory path does not exist: {base_path}"
     if not os.path.isfile(volumes_file):
         error = f"ERROR: volumes data file is missing: {volumes_file}"
-    if (
-        not os.path.isdir(income_stmt_path)
-        or len(find_data_files(income_stmt_path)) == 0
-    ):
-        error = f"ERROR: income statements root directory is empty: {income_stmt_path}"
-    if not os.path.isdir(hours_path) or len(find_data_files(hours_path)) == 0:
-        error = f"ERROR: productivity data root directory is empty: {hours_path}"
+    if len(income_stmt_files) == 0:
+        error = f"ERROR: no income statement files found in {base_path}"
+    if len(hours_files) == 0:
+        error = f"ERROR: no productivity data files found in {base_path}"
 
     if error is not None:
         print(error)
@@ -90,22 +94,42 @@ def sanity_check_data_dir(base_path, volumes_file, income_stmt_path, hours_path)
     return True
 
 
+def file_sha256(path):
+    """
+    Return the sha256 digest of a file's contents as a hex string
+    """
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
 def find_data_files(path, exclude=None):
     """
-    Return list of full path for all files in a directory recursively.
+    Return list of full paths for all files in a directory recursively, plus a dict
+    mapping each path to its last modified timestamp.
     Filter out any files starting with . or ~.
+    Walks with os.scandir directly so modified times come from the directory scan's
+    cached stat() results instead of a second stat() call per file later.
     """
-    ret = []
-    for dirpath, _dirnames, files in os.walk(path):
-        for file in files:
-            # Filter out temporary files: anything that starts with . or ~
-            if not file.startswith(".") and not file.startswith("~"):
-                # Filter out explicitly excluded files
-                filepath = os.path.join(dirpath, file)
-                if exclude is None or filepath not in exclude:
-                    ret.append(filepath)
-
-    return sorted(ret)
+    files = []
+    mtimes = {}
+    exclude_set = frozenset(exclude or ())
+
+    def scan(dirpath):
+        with os.scandir(dirpath) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    scan(entry.path)
+                    continue
+                # Filter out temporary files (anything starting with . or ~) and
+                # explicitly excluded files. A single-slice prefix check covers
+                # both temp prefixes in one comparison.
+                if entry.name[:1] not in (".", "~") and entry.path not in exclude_set:
+                    files.append(entry.path)
+                    mtimes[entry.path] = entry.stat().st_mtime
+
+    scan(path)
+    files.sort()
+    return files, mtimes
 
 
 def main():
@@ -119,20 +143,58 @@ def main():
         base_path
     )
 
-    # Sanity check data directory expected location and files
-    if not sanity_check_data_dir(base_path, volumes_file, income_stmt_path, hours_path):
+    # Get list of dynamic data files, ie data organized as one Excel workbook per month,
+    # along with their modified times from the same directory scan. A missing
+    # directory yields an empty list, which the sanity check below reports.
+    income_stmt_files, income_stmt_mtimes = ([], {})
+    if os.path.isdir(income_stmt_path):
+        income_stmt_files, income_stmt_mtimes = find_data_files(income_stmt_path)
+    hours_files, hours_mtimes = ([], {})
+    if os.path.isdir(hours_path):
+        hours_files, hours_mtimes = find_data_files(
+            hours_path, exclude=[historical_hours_file]
+        )
+
+    # Sanity check data directory expected location and files, reusing the scans above
+    if not sanity_check_data_dir(base_path, volumes_file, income_stmt_files, hours_files):
         logging.error("ERROR: data directory error (see above). Terminating.")
         exit(1)
-
-    # Get list of dynamic data files, ie data organized as one Excel workbook per month
-    income_stmt_files = find_data_files(income_stmt_path)
-    hours_files = find_data_files(hours_path, exclude=[historical_hours_file])
     source_files = (
         [volumes_file, historical_hours_file] + income_stmt_files + hours_files
     )
+    source_mtimes = {
+        volumes_file: os.path.getmtime(volumes_file),
+        historical_hours_file: os.path.getmtime(historical_hours_file),
+        **income_stmt_mtimes,
+        **hours_mtimes,
+    }
     source_files_str = "\n  ".join(source_files)
     logging.info(f"Discovered source files:\n  {source_files_str}")
 
+    # Skip the whole ingest when no source file has changed since the last run.
+    # Stored times roundtrip through a microsecond-precision datetime column, so
+    # compare with a sub-microsecond tolerance rather than exact equality.
+    prior_mtimes = db.get_source_modified_times(output_db_file)
+    if (
+        not args.force
+        and prior_mtimes.keys() == source_mtimes.keys()
+        and all(abs(prior_mtimes[f] - source_mtimes[f]) < 1e-6 for f in source_mtimes)
+    ):
+        logging.info(
+            f"Source files unchanged since last ingest into {output_db_file}. Skipping (rerun with --force to override)."
+        )
+        return
+
+    # Files are sometimes republished with identical contents, which changes the
+    # mtime but not the data. Hashing is far cheaper than parsing, so also skip
+    # when every file's content digest matches the prior run.
+    source_hashes = {file: file_sha256(file) for file in source_files}
+    if not args.force and source_hashes == db.get_source_hashes(output_db_file):
+        logging.info(
+            f"Source file contents unchanged since last ingest into {output_db_file}. Skipping (rerun with --force to override)."
+        )
+        return
+
     # TODO: data verification
     # - volumes_file, List worksheet: verify same data as static_data.WDID_TO_DEPTNAME
     # - Each income statement sheet has Ledger Account cell, and data in columns A:Q
@@ -146,24 +208,58 @@ def main():
     with contextlib.suppress(FileNotFoundError):
         os.remove(TMP_DB_FILE)
     db_engine = create_engine(f"sqlite:///{TMP_DB_FILE}", echo=SHOW_SQL_IN_LOG)
+
+    @event.listens_for(db_engine, "connect")
+    def set_ingest_pragmas(dbapi_conn, _connection_record):
+        # The temp DB is rebuilt from scratch and only moved into place on success,
+        # so crash durability is not needed while loading. PRAGMAs apply per
+        # connection, hence the connect listener.
+        cursor = dbapi_conn.cursor()
+        # page_size only takes effect because the first connection runs this
+        # before create_schema writes the database's first page
+        cursor.execute("PRAGMA page_size=65536")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.execute("PRAGMA journal_mode=OFF")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-200000")
+        cursor.close()
+
     db.create_schema(db_engine)
     logging.info(f"Created tables in {TMP_DB_FILE}")
 
-    # Extract and perform basic transformation of data from spreadsheets
-    volumes_df = parse.read_volume_and_uos_data(volumes_file, VOLUMES_SHEET)
-    uos_df = parse.read_volume_and_uos_data(volumes_file, UOS_SHEET)
+    # Extract and perform basic transformation of data from spreadsheets.
+    # Open the Dashboard Supporting Data workbook once and reuse it across the sheet reads
+    # instead of reparsing the multi-MB file for each one.
+    logging.info(f"Reading {volumes_file}")
+    volumes_wb = parse.open_excel_file(volumes_file)
+    volumes_df = parse.read_volume_and_uos_data(volumes_wb, VOLUMES_SHEET)
+    uos_df = parse.read_volume_and_uos_data(volumes_wb, UOS_SHEET)
     budget_df = parse.read_budget_data(
-        volumes_file, VOLUMES_BUDGET_SHEET, HRS_PER_VOLUME_SHEET, UOS_SHEET
+        volumes_wb, VOLUMES_BUDGET_SHEET, HRS_PER_VOLUME_SHEET, UOS_SHEET
     )
     contracted_hours_updated_month, contracted_hours_df = (
-        parse.read_contracted_hours_data(volumes_file, CONTRACTED_HRS_SHEET)
+        parse.read_contracted_hours_data(volumes_wb, CONTRACTED_HRS_SHEET)
     )
-    income_stmt_df = parse.read_income_stmt_data(income_stmt_files)
-    historical_hours_df = parse.read_historical_hours_and_fte_data(
+    volumes_wb.close()
+    income_stmt_frames = parse.read_income_stmt_data(income_stmt_files)
+    historical_hours_frames = parse.read_historical_hours_and_fte_data(
         historical_hours_file, HISTORICAL_HOURS_YEAR
     )
-    hours_by_pay_period_df = parse.read_hours_and_fte_data(hours_files)
-    hours_by_pay_period_df = pd.concat([historical_hours_df, hours_by_pay_period_df])
+    hours_frames = parse.read_hours_and_fte_data(hours_files)
+
+    # Combine historical and current pay period frames in a single concat, then
+    # calculate pay period start dates once over the combined frame
+    hours_by_pay_period_df = pd.concat(
+        [*historical_hours_frames, *hours_frames], ignore_index=True
+    )
+
+    # Dictionary-encode the heavily repeated department strings; the downstream
+    # transform's groupby and the DB load both handle categoricals
+    for col in ("dept_wd_id", "dept_name"):
+        hours_by_pay_period_df[col] = hours_by_pay_period_df[col].astype("category")
+    hours_by_pay_period_df = parse.add_pay_period_start_date(hours_by_pay_period_df)
 
     # Transform hours data to months
     hours_by_month_df = transform.transform_hours_from_pay_periods_to_months(
@@ -171,7 +267,9 @@ def main():
     )
 
     # Load data into DB. Clear each table prior to loading from dataframe
-    with Session(db_engine) as session:
+    # The ingest session only bulk-deletes and bulk-inserts, so skip autoflush
+    # bookkeeping and don't expire objects after each per-table commit
+    with Session(db_engine, autoflush=False, expire_on_commit=False) as session:
         db.clear_table_and_insert_data(session, Volume, volumes_df)
         db.clear_table_and_insert_data(session, UOS, uos_df)
         db.clear_table_and_insert_data(session, Budget, budget_df)
@@ -180,13 +278,20 @@ def main():
         )
         db.clear_table_and_insert_data(session, Hours, hours_by_month_df)
         db.clear_table_and_insert_data(session, ContractedHours, contracted_hours_df)
-        db.clear_table_and_insert_data(session, IncomeStmt, income_stmt_df)
+        db.clear_table_and_insert_data(session, IncomeStmt, income_stmt_frames)
+
+        # Commit all table loads as a single transaction; the temp DB is discarded
+        # on failure, so there is nothing to preserve between tables
+        session.commit()
 
     # Update last ingest time and modified times for source data files
-    modified = {
-        file: datetime.fromtimestamp(os.path.getmtime(file)) for file in source_files
-    }
-    db.update_meta(db_engine, modified, contracted_hours_updated_month)
+    db.update_meta(db_engine, source_mtimes, source_hashes, contracted_hours_updated_month)
+
+    # Gather table statistics so the dashboard's queries against the finished DB
+    # get better query plans. VACUUM is unnecessary - the file was built fresh in
+    # one pass and has no free pages to reclaim.
+    with db_engine.connect() as conn:
+        conn.exec_driver_sql("ANALYZE")
 
     # Move new database in place
     db_engine.dispose()
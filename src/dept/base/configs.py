@@ -2,6 +2,7 @@
 Definitions for supported departments
 """
 from dataclasses import dataclass, field
+from functools import cached_property
 from ... import route
 
 
@@ -10,6 +11,20 @@ class DeptConfig:
     name: str
     wd_ids: list = field(default_factory=list)
 
+    @cached_property
+    def all_wd_ids(self) -> tuple:
+        """All department ID strings in wd_ids, flattened across nested DeptConfigs.
+        Configs are static, so this is computed once per config instead of on every request."""
+        ret = []
+        stack = list(reversed(self.wd_ids))
+        while stack:
+            item = stack.pop()
+            if isinstance(item, DeptConfig):
+                stack.extend(reversed(item.wd_ids))
+            else:
+                ret.append(item)
+        return tuple(ret)
+
 
 DEPT_CONFIG = {
     route.ADMIN: DeptConfig("Administration", ["CC_86000"]),
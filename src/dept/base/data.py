@@ -35,6 +35,39 @@ class DeptData:
     stats: dict
 
 
+# Processed DeptData cached per (source version, dept config, dept, month).
+# Source data is immutable for a given load, so identical settings always produce
+# identical results; keying on src.last_updated invalidates when data is reloaded.
+_process_cache = {}
+
+# Income statements for the latest data month, cached per department group.
+# _calc_stats needs the same month_max statement for every selected month of a
+# department, so build it lazily once per source load instead of per request.
+_latest_stmt_cache = {}
+
+# Hour/FTE columns shown in the FTE tab summary tables, and the zero-filled
+# summary returned when there is no hours data. Callers treat it as read-only,
+# so one shared instance is returned instead of allocating per call.
+_HOURS_COLS = [
+    "reg_hrs",
+    "overtime_hrs",
+    "prod_hrs",
+    "nonprod_hrs",
+    "total_hrs",
+    "total_fte",
+]
+_EMPTY_HOURS = pd.Series(0.0, index=_HOURS_COLS)
+
+# Columns shown in the monthly hours/FTE history graph
+_HOURS_HIST_COLS = [
+    "month",
+    "prod_hrs",
+    "nonprod_hrs",
+    "total_hrs",
+    "total_fte",
+]
+
+
 def process(
     config: DeptConfig, settings: dict, src: source_data.SourceData
 ) -> DeptData:
@@ -42,39 +75,65 @@ def process(
     Receives raw source data from database.
     Partitions and computes statistics to be displayed by the app.
     settings contains any configuration from the sidebar that the user selects.
+    Results are memoized so Streamlit reruns with unchanged settings skip all of
+    the filtering and aggregation below.
     """
     dept_id, month = (
         settings["dept_id"],
         settings["month"],
     )
 
-    # Get department IDs that we will be matching
-    wd_ids = _get_all_wd_ids(config if dept_id == "All" else dept_id)
+    # Get department IDs that we will be matching. The user may select "All", a
+    # single ID, or a nested sub-config; configs pre-flatten their IDs, so this
+    # is a lookup rather than a tree walk per request.
+    if dept_id == "All":
+        wd_ids = list(config.all_wd_ids)
+    elif isinstance(dept_id, DeptConfig):
+        wd_ids = list(dept_id.all_wd_ids)
+    else:
+        wd_ids = [dept_id]
+
+    # Drop stale entries when the source data has been reloaded. The key uses the
+    # flattened IDs since a sub-config selection itself isn't hashable.
+    if _process_cache and next(iter(_process_cache))[0] != src.last_updated:
+        _process_cache.clear()
+    cache_key = (src.last_updated, config.name, tuple(wd_ids), month)
+    cached = _process_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Membership tests below use a frozenset so isin() hashes against a set
+    # instead of scanning a list per row
+    wd_ids_set = frozenset(wd_ids)
 
     # Group volume data by department and month
-    volumes_df = src.volumes_df[src.volumes_df["dept_wd_id"].isin(wd_ids)]
+    volumes_df = src.volumes_df[src.volumes_df["dept_wd_id"].isin(wd_ids_set)]
     volumes = _calc_volumes_history(volumes_df)
 
     # Group UOS data by department and month
-    uos_df = src.uos_df[src.uos_df["dept_wd_id"].isin(wd_ids)]
+    uos_df = src.uos_df[src.uos_df["dept_wd_id"].isin(wd_ids_set)]
     uos = _calc_volumes_history(uos_df)
 
     # Organize income statement data into a human readable table grouped into categories
-    income_stmt_df = src.income_stmt_df[src.income_stmt_df["dept_wd_id"].isin(wd_ids)]
+    income_stmt_df = src.income_stmt_df[
+        src.income_stmt_df["dept_wd_id"].isin(wd_ids_set)
+    ]
     income_stmt = _calc_income_stmt_for_month(income_stmt_df, month)
 
     # Create summary tables for hours worked by month and year
-    hours_df = src.hours_df[src.hours_df["dept_wd_id"].isin(wd_ids)]
+    hours_df = src.hours_df[src.hours_df["dept_wd_id"].isin(wd_ids_set)]
     hours = _calc_hours_history(hours_df)
     hours_for_month = _calc_hours_for_month(hours_df, month)
     hours_ytm = _calc_hours_ytm(hours_df, month)
 
     # Summary table for contracted hours
     contracted_hours_df = src.contracted_hours_df[
-        src.contracted_hours_df["dept_wd_id"].isin(wd_ids)
+        src.contracted_hours_df["dept_wd_id"].isin(wd_ids_set)
     ]
 
-    # Pre-calculate statistics that are individual numbers, like overall revenue per encounter
+    # Pre-calculate statistics that are individual numbers, like overall revenue per encounter.
+    # Pass the income statement generated above so it can be reused when the
+    # selected month is also the latest month with data.
     stats = _calc_stats(
         wd_ids,
         settings,
@@ -84,9 +143,15 @@ def process(
         income_stmt_df,
         hours_df,
         contracted_hours_df,
+        income_stmt,
     )
 
-    return DeptData(
+    # Months with no payroll rows still get the shared zero-filled Series from
+    # _calc_hours_for_month, so flag them here for the UI's "No data for this
+    # month" message rather than having it infer emptiness from the shape
+    stats["no_hours_data"] = not (hours_df["month"] == month).any()
+
+    ret = DeptData(
         dept=wd_ids,
         month=month,
         volumes=volumes,
@@ -96,24 +161,8 @@ def process(
         income_stmt=income_stmt,
         stats=stats,
     )
-
-
-def _get_all_wd_ids(id_list):
-    """Recursively find all ID strings in a mixed list of IDs and DeptConfig objects"""
-    if isinstance(id_list, str):
-        # ID is just one string, return it as single element in list
-        return [id_list]
-    elif isinstance(id_list, DeptConfig):
-        return _get_all_wd_ids(id_list.wd_ids)
-    else:
-        # Return all strings in wd_ids and recurse into any embedded DeptConfigs
-        ret = []
-        for id in id_list:
-            if isinstance(id, DeptConfig):
-                ret += _get_all_wd_ids(id.wd_ids)
-            else:
-                ret.append(id)
-        return ret
+    _process_cache[cache_key] = ret
+    return ret
 
 
 def _calc_volumes_history(df: pd.DataFrame) -> pd.DataFrame:
@@ -121,6 +170,8 @@ def _calc_volumes_history(df: pd.DataFrame) -> pd.DataFrame:
     Returns volumes for each month totaled across all departments in data set, sorted in reverse chronologic order by month
     """
     # Group rows by month. Sum the volume and keep the first value for unit.
+    # groupby already returns groups sorted by key, so reverse-chronologic order
+    # is just the reversed view - no separate sort needed.
     df = (
         df.groupby("month")
         .agg(
@@ -129,7 +180,7 @@ def _calc_volumes_history(df: pd.DataFrame) -> pd.DataFrame:
         )
         .reset_index()
     )
-    return df.sort_values(by=["month"], ascending=[False])
+    return df.iloc[::-1]
 
 
 def _calc_hours_for_month(df: pd.DataFrame, month: str) -> pd.DataFrame:
@@ -141,40 +192,28 @@ def _calc_hours_for_month(df: pd.DataFrame, month: str) -> pd.DataFrame:
     df = df[df["month"] == month].reset_index(drop=True)
 
     # Return the columns that are displayed in the FTE tab summary table
-    columns = [
-        "reg_hrs",
-        "overtime_hrs",
-        "prod_hrs",
-        "nonprod_hrs",
-        "total_hrs",
-        "total_fte",
-    ]
     if df.shape[0] > 0:
-        return df.loc[:, columns].sum()
+        return df.loc[:, _HOURS_COLS].sum()
     else:
-        return pd.DataFrame(columns=columns)
+        # Callers read these as a Series of numbers, so return zeros rather than
+        # an empty frame
+        return _EMPTY_HOURS
 
 
 def _calc_hours_ytm(df: pd.DataFrame, month: str) -> pd.DataFrame:
     """
     Return a dataframe with a single row containing the sum of the productive/non-productive hours across all departments for this year
     """
-    # Filter all rows that are in the same year and come before the given month
+    # Filter all rows that are in the same year and come before the given month.
+    # YYYY-MM strings sort lexicographically, so the year check is a plain range
+    # comparison rather than a per-value str.startswith
     [year_num, month_num] = month.split("-")
-    df = df[df["month"].str.startswith(year_num) & (df["month"] <= month)]
+    df = df[df["month"].between(f"{year_num}-01", month)]
 
     # Sum all rows, except FTE. Return columns that are displayed in the FTE tab summary table.
     # FTE needs to be recalculated based on the month number in the year.
-    columns = [
-        "reg_hrs",
-        "overtime_hrs",
-        "prod_hrs",
-        "nonprod_hrs",
-        "total_hrs",
-        "total_fte",
-    ]
     if df.shape[0] > 0:
-        df = df[columns]
+        df = df[_HOURS_COLS]
         ret = df.sum()
 
         # For January, just use data in FTE column. Do not recalculate total_fte using hours. Use calculation for
@@ -186,24 +225,19 @@ def _calc_hours_ytm(df: pd.DataFrame, month: str) -> pd.DataFrame:
             )
         return ret
     else:
-        return pd.DataFrame(columns=columns)
+        # Callers read these as a Series of numbers, so return zeros rather than
+        # an empty frame
+        return _EMPTY_HOURS
 
 
 def _calc_hours_history(df: pd.DataFrame) -> pd.DataFrame:
     """
     Returns productive / non-productive hours and FTE for each month totaled across departments, sorted in reverse chronologic order by month
     """
-    df = df.groupby("month").sum().reset_index()
-    df = df.sort_values(by=["month"], ascending=[True])
-    return df[
-        [
-            "month",
-            "prod_hrs",
-            "nonprod_hrs",
-            "total_hrs",
-            "total_fte",
-        ]
-    ]
+    # Project down to the displayed columns before grouping so the sum never
+    # touches the dept ID/name and other hour columns that would be discarded.
+    # groupby returns groups sorted by month already, so no separate sort is needed.
+    return df[_HOURS_HIST_COLS].groupby("month").sum().reset_index()
 
 
 def _calc_contracted_hours(df: pd.DataFrame) -> pd.DataFrame:
@@ -229,6 +263,7 @@ def _calc_stats(
     income_stmt_df: pd.DataFrame,  # all income statment data for sub-departments, all months
     hours: pd.DataFrame,  # prod/non-prod hours and FTE for each sub-department
     contracted_hours_df: pd.DataFrame,  # traveler hours, currently pulled from manual entries in spreadsheet
+    income_stmt_for_sel_month: pd.DataFrame = None,  # income statement already generated for the selected month
 ) -> dict:
     """Precalculate statistics from raw data that will be displayed on dashboard"""
     s = {}
@@ -239,6 +274,24 @@ def _calc_stats(
     prior_year = sel_year - 1
     month_in_prior_year = f"{prior_year:04d}-{month_of_sel_month:02d}"
 
+    # Budget rows for these departments - one row per department for the year
+    budget_rows = src.budget_df[src.budget_df["dept_wd_id"].isin(frozenset(wd_ids))]
+
+    # When a department has no rows in any source table, every stat below works
+    # out to zero. Return them directly instead of running the aggregation and
+    # income statement pipeline on empty frames. With no data to derive a
+    # display month from, _max_month_to_display falls back to the current month.
+    if (
+        volumes.empty
+        and uos.empty
+        and income_stmt_df.empty
+        and hours.empty
+        and contracted_hours_df.empty
+        and budget_rows.empty
+    ):
+        month_max, _, _ = _max_month_to_display(volumes, uos, income_stmt_df)
+        return _zeroed_stats(month_max, month_in_prior_year, src)
+
     # Get the latest month that we will display depending on volume and income statement data available
     month_max, month_max_year, month_max_month = _max_month_to_display(
         volumes, uos, income_stmt_df
@@ -254,13 +307,12 @@ def _calc_stats(
     kpi_uos_df = volumes if uos.empty else uos
 
     # Get the volume and UOS for the selected month / year. These tables have
-    # one number in the volume column for each department per month
+    # one number in the volume column for each department per month. Year-to-month
+    # filters are range comparisons on the sortable YYYY-MM strings.
     if not volumes.empty:
         month_volume = volumes.loc[volumes["month"] == sel_month, "volume"].sum()
         ytm_volume = volumes.loc[
-            volumes["month"].str.startswith(str(sel_year))
-            & (volumes["month"] <= sel_month),
-            "volume",
+            volumes["month"].between(f"{sel_year}-01", sel_month), "volume"
         ].sum()
         volume_unit = volumes.at[0, "unit"]
     if not uos.empty:
@@ -269,26 +321,24 @@ def _calc_stats(
             uos["month"] == month_in_prior_year, "volume"
         ].sum()
         ytm_uos_in_prior_year = uos.loc[
-            uos["month"].str.startswith(str(prior_year))& (uos["month"] <= month_in_prior_year), "volume"
+            uos["month"].between(f"{prior_year}-01", month_in_prior_year), "volume"
         ].sum()
         ytm_uos = uos.loc[
-            uos["month"].str.startswith(str(sel_year)) & (uos["month"] <= sel_month),
-            "volume",
+            uos["month"].between(f"{sel_year}-01", sel_month), "volume"
         ].sum()
         uos_unit = uos.at[0, "unit"]
 
     # Get the denominator for KPI calculations - either YTD volume or UOS
     if not kpi_uos_df.empty:
         kpi_ytd_volume = kpi_uos_df.loc[
-            kpi_uos_df["month"].str.startswith(str(month_max_year))
-            & (kpi_uos_df["month"] <= month_max),
-            "volume",
+            kpi_uos_df["month"].between(f"{month_max_year}-01", month_max), "volume"
         ].sum()
 
     # There is one budget row for each department. Sum them for overall budget,
     # and divide by the months in the year so far for the YTD volume and hours budgets.
-    budget_df = src.budget_df[src.budget_df["dept_wd_id"].isin(wd_ids)]
-    budget_df = budget_df[
+    # Read the handful of budget scalars out of a plain dict; the repeated reads
+    # below then skip pandas' per-access index hashing
+    budget = budget_rows[
         [
             "budget_fte",
             "budget_prod_hrs",
@@ -297,30 +347,30 @@ def _calc_stats(
             "budget_prod_hrs_per_uos",
             "hourly_rate",
         ]
-    ].sum()
+    ].sum().to_dict()
     # If there is more than one department, recalculate values that cannot just be summed across depts
     if len(wd_ids) > 1:
         # Prefer using UOS data to volume. If no data available, zero out the budgeted hrs per UOS
-        if budget_df["budget_uos"] > 0:
-            budget_df["budget_prod_hrs_per_uos"] = (
-                budget_df["budget_prod_hrs"] / budget_df["budget_uos"]
+        if budget["budget_uos"] > 0:
+            budget["budget_prod_hrs_per_uos"] = (
+                budget["budget_prod_hrs"] / budget["budget_uos"]
             )
-        elif uos.empty and budget_df["budget_volume"] > 0:
-            budget_df["budget_prod_hrs_per_uos"] = (
-                budget_df["budget_prod_hrs"] / budget_df["budget_volume"]
+        elif uos.empty and budget["budget_volume"] > 0:
+            budget["budget_prod_hrs_per_uos"] = (
+                budget["budget_prod_hrs"] / budget["budget_volume"]
             )
         else:
-            budget_df["budget_prod_hrs_per_uos"] = 0
+            budget["budget_prod_hrs_per_uos"] = 0
 
         # Calculate average of hourly rates - this is not entirely accurate, since pay/hours are not distributed
         # evenly across departments. When possible, this will be recalulated below using (YTD salary / YTD hours)
-        budget_df["hourly_rate"] = budget_df["hourly_rate"] / len(wd_ids)
+        budget["hourly_rate"] = budget["hourly_rate"] / len(wd_ids)
 
     # Get the YTD budgeted volume based on the proportion of the annual budgeted volume
     # for the number of months of the year for which we have revenue / income statement information
     # Prefer UOS data if available, otherwise use volume
     budget_volume_for_kpi = (
-        budget_df.at["budget_uos"] if not uos.empty else budget_df.at["budget_volume"]
+        budget["budget_uos"] if not uos.empty else budget["budget_volume"]
     )
     ytd_budget_volume_for_kpi = budget_volume_for_kpi * (int(month_max_month) / 12)
 
@@ -354,9 +404,26 @@ def _calc_stats(
     # for revenue vs expenses.
     #
     # First, generate income statment for the latest month available in the data. The "month"
-    # column is in the format "YYYY-MM".
-    latest_income_stmt_df = income_stmt_df[income_stmt_df["month"] == month_max]
-    income_stmt_ytd = income_statment.generate_income_stmt(latest_income_stmt_df)
+    # column is in the format "YYYY-MM". When the user has the latest month selected
+    # (the common case), the statement generated for the content pane is identical,
+    # so reuse it instead of filtering and generating a second one.
+    if sel_month == month_max and income_stmt_for_sel_month is not None:
+        income_stmt_ytd = income_stmt_for_sel_month
+    else:
+        # The month_max statement depends only on the departments and the data
+        # load, not the selected month, so cache it across requests
+        if _latest_stmt_cache and next(iter(_latest_stmt_cache))[0] != src.last_updated:
+            _latest_stmt_cache.clear()
+        stmt_key = (src.last_updated, frozenset(wd_ids), month_max)
+        income_stmt_ytd = _latest_stmt_cache.get(stmt_key)
+        if income_stmt_ytd is None:
+            latest_income_stmt_df = income_stmt_df[
+                income_stmt_df["month"] == month_max
+            ]
+            income_stmt_ytd = income_statment.generate_income_stmt(
+                latest_income_stmt_df
+            )
+            _latest_stmt_cache[stmt_key] = income_stmt_ytd
     # Pull the YTD Actual and YTD Budget totals for revenue and expenses
     # Those columns can change names, so index them as the second to last, or -2 column (YTD Actual),
     # and last, or -1 column (YTD Budget)
@@ -375,11 +442,14 @@ def _calc_stats(
             "Expenses|Professional Fees|60222:Locum Tenens"
         )
     ].sum()
-    ytd_revenue = df_revenue.iloc[-2]
-    ytd_budget_revenue = df_revenue.iloc[-1]
-    ytd_expense = df_expense.iloc[0, -2]
-    ytd_budget_expense = df_expense.iloc[0, -1]
-    ytd_salary = df_salary.iloc[-2]
+    revenue_row = df_revenue.to_numpy()
+    expense_row = df_expense.to_numpy()[0]
+    salary_row = df_salary.to_numpy()
+    ytd_revenue = revenue_row[-2]
+    ytd_budget_revenue = revenue_row[-1]
+    ytd_expense = expense_row[-2]
+    ytd_budget_expense = expense_row[-1]
+    ytd_salary = salary_row[-2]
 
     # Unit definitions for UOS and volumes
     s["uos_unit"] = uos_unit
@@ -392,15 +462,15 @@ def _calc_stats(
     # Volumes and budgets for the selected month and YTD show up on the Volumes tab, Summary section
     s["month_volume"] = month_volume
     s["ytm_volume"] = ytm_volume
-    s["month_budget_volume"] = budget_df.at["budget_volume"] / 12
-    s["ytm_budget_volume"] = budget_df.at["budget_volume"] * (month_of_sel_month / 12)
+    s["month_budget_volume"] = budget["budget_volume"] / 12
+    s["ytm_budget_volume"] = budget["budget_volume"] * (month_of_sel_month / 12)
     s["month_uos"] = month_uos
     s["ytm_uos"] = ytm_uos
     s["prior_year_month_uos"] = month_uos_in_prior_year
     s["prior_year_ytm_uos"] = ytm_uos_in_prior_year
 
     # Budgeted FTE shows up as a threshold line on the FTE graph
-    s["budget_fte"] = budget_df.at["budget_fte"]
+    s["budget_fte"] = budget["budget_fte"]
 
     # KPIs
     s["revenue_per_volume"] = ytd_revenue / kpi_ytd_volume if kpi_ytd_volume > 0 else 0
@@ -422,7 +492,7 @@ def _calc_stats(
         s["variance_expense_per_volume"] = 0
 
     s["hours_per_volume"] = ytd_prod_hours / kpi_ytd_volume if kpi_ytd_volume > 0 else 0
-    s["target_hours_per_volume"] = budget_df.at["budget_prod_hrs_per_uos"]
+    s["target_hours_per_volume"] = budget["budget_prod_hrs_per_uos"]
     s["variance_hours_per_volume"] = (
         s["target_hours_per_volume"] - s["hours_per_volume"]
     )
@@ -453,9 +523,77 @@ def _calc_stats(
     s["prior_year_contracted_hours"] = contracted_hours_prior_year_df["hrs"]
     s["prior_year_contracted_fte"] = contracted_fte_prior_year
 
+    # "No data for department" flags, precomputed here (cached with the rest of
+    # the stats) so the UI doesn't rescan individual stats on every rerun
+    s["no_kpi_data"] = not any(
+        (
+            s["revenue_per_volume"],
+            s["target_revenue_per_volume"],
+            s["expense_per_volume"],
+            s["target_expense_per_volume"],
+            s["hours_per_volume"],
+            s["fte_variance"],
+        )
+    )
+    s["no_volume_data"] = not any(
+        (
+            s["month_volume"],
+            s["month_budget_volume"],
+            s["ytm_volume"],
+            s["ytm_budget_volume"],
+        )
+    )
+
     return s
 
 
+def _zeroed_stats(month_max: str, month_in_prior_year: str, src) -> dict:
+    """Stats dict for a department with no data in any source table: all values zero except the date labels"""
+    year_for_contracted_hours = date.today().year
+    month_num_for_contracted_hours = datetime.strptime(
+        src.contracted_hours_updated_month[:10], "%Y-%m-%d"
+    ).month
+    month_for_contracted_hours = (
+        f"{year_for_contracted_hours:4d}-{month_num_for_contracted_hours:02d}"
+    )
+    return {
+        "uos_unit": "undefined",
+        "volume_unit": "undefined",
+        "kpi_month_max": month_max,
+        "month_in_prior_year": month_in_prior_year,
+        "month_volume": 0,
+        "ytm_volume": 0,
+        "month_budget_volume": 0,
+        "ytm_budget_volume": 0,
+        "month_uos": 0,
+        "ytm_uos": 0,
+        "prior_year_month_uos": 0,
+        "prior_year_ytm_uos": 0,
+        "budget_fte": 0,
+        "revenue_per_volume": 0,
+        "expense_per_volume": 0,
+        "target_revenue_per_volume": 0,
+        "variance_revenue_per_volume": 0,
+        "target_expense_per_volume": 0,
+        "variance_expense_per_volume": 0,
+        "hours_per_volume": 0,
+        "target_hours_per_volume": 0,
+        "variance_hours_per_volume": 0,
+        "variance_hours_per_volume_pct": 0,
+        "fte_variance": 0,
+        "fte_variance_dollars": 0,
+        "contracted_hours_month": util.YYYY_MM_to_month_str(month_for_contracted_hours),
+        "contracted_hours": 0,
+        "contracted_fte": 0,
+        "prior_year_for_contracted_hours": str(year_for_contracted_hours - 1),
+        "prior_year_contracted_hours": 0,
+        "prior_year_contracted_fte": 0,
+        "no_kpi_data": True,
+        "no_volume_data": True,
+        "no_hours_data": True,
+    }
+
+
 def _max_month_to_display(
     volumes: pd.DataFrame,
     uos: pd.DataFrame,
@@ -471,6 +609,9 @@ def _max_month_to_display(
     kpi_volumes_max = kpi_volumes["month"].max()
     kpi_volumes_max = "" if pd.isna(kpi_volumes_max) else kpi_volumes_max
     income_stmt_month_max = income_stmt_df["month"].max()
+    income_stmt_month_max = (
+        "" if pd.isna(income_stmt_month_max) else income_stmt_month_max
+    )
 
     month_max = min(kpi_volumes_max, income_stmt_month_max)
     month_max = cur_month if month_max == "" else month_max
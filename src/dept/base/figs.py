@@ -1,12 +1,68 @@
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
-from datetime import datetime
 from st_aggrid import AgGrid, GridOptionsBuilder, ColumnsAutoSizeMode, JsCode
 from ... import util
 
 
+# JsCode blocks for the income statement grid, built once at import instead of
+# per grid build. Bold these Ledger Account rows:
+_INCOME_STMT_BOLD_ROWS = [
+    "Operating Revenues",
+    "Total Revenue",
+    "Net Revenue",
+    "Expenses",
+    "Total Operating Expenses",
+    "Operating Margin",
+    "Contribution Margin",
+]
+
+# Bold rows based on contents of the Ledger Account column
+_INCOME_STMT_ROW_STYLE_JS = JsCode(
+    f"""
+      function(params) {{
+          if ({ str(_INCOME_STMT_BOLD_ROWS) }.includes(params?.data?.['Ledger Account'])) {{
+              return {{'font-weight': 'bold'}}
+          }}
+      }}
+      """
+)
+
+# innerRenderer() returning null results in blank text for grouped rows
+_EMPTY_INNER_RENDERER_JS = JsCode("function() {}")
+
+# For grouped rows (those that have a hier value with a |), use the
+# default renderer agGroupCellRenderer, which will show the toggle button
+# and call innerRenderer to determine the text to show.
+#
+# For non-grouped rows, just return an empty <span> so no text is shown.
+_GROUP_CELL_RENDERER_SELECTOR_JS = JsCode(
+    """
+    function(params) {
+        class EmptyRenderer {
+            getGui() { return document.createElement('span') }
+            refresh() { return true; }
+        }
+        if (params.value && !params.value.indexOf('|')) {
+            return null
+        } else {
+            return {
+                component: 'agGroupCellRenderer',
+            };
+        }
+    }
+    """,
+)
+
+_HIER_DATA_PATH_JS = JsCode("function(data) { return data.hier.split('|'); }")
+
+_CURRENCY_FORMATTER_JS = JsCode(
+    "function(params) { return (params.value == null) ? params.value : params.value.toLocaleString('en-US', {style:'currency', currency:'USD', currencySign: 'accounting', maximumFractionDigits: 0}) }"
+)
+
+
 # Display a gauge chart with 0% variance in the middle
 def kpi_gauge(title, variance_pct, yellow_threshold, red_threshold, gauge_max, key=None):
     color = "#238823"
@@ -74,24 +130,48 @@ def kpi_gauge(title, variance_pct, yellow_threshold, red_threshold, gauge_max, k
 
 
 def aggrid_income_stmt(df, month=None):
-    # Bold these Ledger Account rows
-    bold_rows = [
-        "Operating Revenues",
-        "Total Revenue",
-        "Net Revenue",
-        "Expenses",
-        "Total Operating Expenses",
-        "Operating Margin",
-        "Contribution Margin",
-    ]
-
     # Update YTD column headers for the specific month
     if month:
         # Convert month from format "2023-01" to "Jan 2023"
-        month = datetime.strptime(month, "%Y-%m").strftime("%b %Y")
-        df.columns.values[-2] = f"Actual, Year to {month}"
-        df.columns.values[-1] = f"Budget, Year to {month}"
+        month = util.YYYY_MM_to_month_str(month)
+        # Assign a new columns list rather than writing into the Index's array,
+        # which pandas may back with read-only storage
+        cols = list(df.columns)
+        cols[-2] = f"Actual, Year to {month}"
+        cols[-1] = f"Budget, Year to {month}"
+        df.columns = cols
 
+    # Finally show data table
+    AgGrid(
+        df,
+        height=810,
+        gridOptions=_build_income_stmt_grid_options(df),
+        # columns_auto_size_mode=ColumnsAutoSizeMode.FIT_CONTENTS,
+        allow_unsafe_jscode=True,
+    )
+    # Work around to ensure that AgGrid height doesn't collapse when in non-active tab after user interactions
+    st.markdown(
+        """
+        <style>
+            .element-container iframe {
+                min-height: 810px;
+            }
+        </style>
+        """,
+        unsafe_allow_html=True,
+    )
+
+
+# The grid options only depend on the column names (the month is baked into the
+# YTD headers by the caller), so hash the dataframe by its columns and reuse the
+# built options dict across reruns instead of reassembling it each time.
+# cache_resource rather than cache_data: the built options aren't picklable
+# (GridOptionsBuilder returns nested defaultdicts with a closure factory), and
+# AgGrid treats them as read-only, so sharing the cached dict is safe.
+@st.cache_resource(
+    show_spinner=False, hash_funcs={pd.DataFrame: lambda df: tuple(df.columns)}
+)
+def _build_income_stmt_grid_options(df):
     # Create AgGrid display configuration to do row grouping and bolding
     gb = GridOptionsBuilder.from_dataframe(df)
     gb.configure_grid_options(
@@ -99,52 +179,22 @@ def aggrid_income_stmt(df, month=None):
         skipHeaderOnAutoSize=True,
         suppressColumnVirtualisation=True,
         # Bold columns based on contents of the Legder Account column
-        getRowStyle=JsCode(
-            f"""
-              function(params) {{
-                  if ({ str(bold_rows) }.includes(params?.data?.['Ledger Account'])) {{
-                      return {{'font-weight': 'bold'}}
-                  }}
-              }}
-              """
-        ),
+        getRowStyle=_INCOME_STMT_ROW_STYLE_JS,
         # Row grouping
         autoGroupColumnDef=dict(
             # Don't show a column name
             headerName="",
             maxWidth=90,
             # Don't add suffice with count of grouped up rows - eg. "> Supplies (10)"
-            # And innerRenderer() returning null results in blank text for grouped rows
             cellRendererParams=dict(
-                suppressCount=True, innerRenderer=JsCode("function() {}")
-            ),
-            # For grouped rows (those that have a hier value with a |), use the
-            # default renderer agGroupCellRenderer, which will show the toggle button
-            # and call innerRenderer to determine the text to show.
-            #
-            # For non-grouped rows, just return an empty <span> so no text is shown.
-            cellRendererSelector=JsCode(
-                """
-                function(params) {
-                    class EmptyRenderer {
-                        getGui() { return document.createElement('span') }
-                        refresh() { return true; }
-                    }
-                    if (params.value && !params.value.indexOf('|')) {
-                        return null
-                    } else {
-                        return {
-                            component: 'agGroupCellRenderer',
-                        };
-                    }
-                }
-                """,
+                suppressCount=True, innerRenderer=_EMPTY_INNER_RENDERER_JS
             ),
+            cellRendererSelector=_GROUP_CELL_RENDERER_SELECTOR_JS,
         ),
         # Row grouping is actually using AgGrid Tree Data mode. See _hierarchy_from_row_groups() for
         # how the tree paths are generated.
         treeData=True,
-        getDataPath=JsCode("function(data) { return data.hier.split('|'); }"),
+        getDataPath=_HIER_DATA_PATH_JS,
         animateRows=True,
         groupDefaultExpanded=1,
     )
@@ -158,45 +208,45 @@ def aggrid_income_stmt(df, month=None):
         df.columns[-4:],
         type=["numericColumn", "numberColumnFilter", "customNumericFormat"],
         aggFunc="sum",
-        valueFormatter=JsCode(
-            "function(params) { return (params.value == null) ? params.value : params.value.toLocaleString('en-US', {style:'currency', currency:'USD', currencySign: 'accounting', maximumFractionDigits: 0}) }"
-        ),
+        valueFormatter=_CURRENCY_FORMATTER_JS,
     )
 
-    # Finally show data table
-    AgGrid(
-        df,
-        height=810,
-        gridOptions=gb.build(),
-        # columns_auto_size_mode=ColumnsAutoSizeMode.FIT_CONTENTS,
-        allow_unsafe_jscode=True,
-    )
-    # Work around to ensure that AgGrid height doesn't collapse when in non-active tab after user interactions
-    st.markdown(
-        """
-        <style>
-            .element-container iframe {
-                min-height: 810px;
-            }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    return gb.build()
+
+
+# Cache built figures across reruns so unchanged filter selections reuse the
+# same Figure object instead of rebuilding and re-serializing it. DataFrame
+# arguments are keyed on a content hash of their values.
+_DF_VALUES_HASH = {
+    pd.DataFrame: lambda df: pd.util.hash_pandas_object(df, index=False).values.tobytes()
+}
 
 
 def volumes_fig(src, group_by_month):
+    st.plotly_chart(_build_volumes_fig(src, group_by_month), use_container_width=True)
+
+
+@st.cache_resource(max_entries=32, show_spinner=False, hash_funcs=_DF_VALUES_HASH)
+def _build_volumes_fig(src, group_by_month):
     if group_by_month:
         # Groups data by month, show a bar for each year above each month
         df = util.group_data_by_month(src, month_col="month", value_col="volume")
-        df.columns = ["Month", "Volume", "Year"]
-        color = "Year"
+        x, color = "Month", "Year"
     else:
-        # Display as normal time series data
-        df = src.copy()
-        df = df.rename(columns={"month": "Month", "volume": "Volume"})
-        color = None
+        # Display as normal time series data. Axis titles come from labels=
+        # below, so no copy/rename of the source frame is needed.
+        df = src
+        x, color = "month", None
 
-    fig = px.bar(df, x="Month", y="Volume", text="Volume", color=color, barmode="group")
+    fig = px.bar(
+        df,
+        x=x,
+        y="volume",
+        text="volume",
+        color=color,
+        barmode="group",
+        labels={"month": "Month", "volume": "Volume"},
+    )
     fig.update_traces(
         hovertemplate="%{y} exams",
         texttemplate="%{text:,}",
@@ -208,61 +258,55 @@ def volumes_fig(src, group_by_month):
         xaxis_title=None,
         yaxis_title=None,
     )
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
+
+
+# Static CSS for the employee hours table. Emitted as-is with the hand-built
+# table HTML below, instead of going through pandas Styler, which renders a
+# unique CSS class per cell through Jinja2 - far heavier than this fixed 6x3
+# table warrants. Same borders and row bolding as the Styler version produced.
+_HOURS_TABLE_STYLE = """<style>
+.hours-table { margin-left: 25px; }
+.hours-table tr { border-top: 0px; }
+.hours-table th, .hours-table td { border: 0px; text-align: right; }
+.hours-table td { padding: 3px 13px; }
+.hours-table td:nth-child(2), .hours-table td:nth-child(3) { border-bottom: 1px solid black; }
+.hours-table tr:last-child td:nth-child(2), .hours-table tr:last-child td:nth-child(3) { border-bottom: 2px solid black; }
+.hours-table tr:last-child, .hours-table tr:nth-last-child(2) { font-weight: bold; }
+</style>"""
+
+_HOURS_TABLE_ROW_LABELS = [
+    "Regular Hours",
+    "Overtime Hours",
+    "Productive Hours",
+    "Non-productive Hours",
+    "Total Hours",
+    "Total FTE",
+]
 
 
 def hours_table(month, hours_for_month, hours_ytd):
-    # Combine hours for month and YTD hours into single table
-    # Transpose to so the numbers appear in columns
-    df = pd.DataFrame([hours_for_month, hours_ytd]).T.reset_index()
-
     # Convert month from format "2023-01" to "Jan 2023"
     month = util.YYYY_MM_to_month_str(month)
-    df.columns = ["", f"Month ({month})", f"Year to {month}"]
-
-    # Assign row headers
-    df.loc[:, ""] = [
-        "Regular Hours",
-        "Overtime Hours",
-        "Productive Hours",
-        "Non-productive Hours",
-        "Total Hours",
-        "Total FTE",
-    ]
 
-    # Round all numbers in table except for the first column (labels). Last row should have 1 decimal place
-    df.iloc[:-1, 1:] = df.iloc[:-1, 1:].applymap(lambda x: f"{x:.0f}")
-    df.iloc[-1, 1:] = df.iloc[-1, 1:].apply(lambda x: f"{x:.1f}")
-
-    # Create borders and row bolding
-    left_margin = 25
-    styled_df = (
-        df.style.hide(axis=0)
-        .set_table_styles(
-            [
-                {"selector": "", "props": [("margin-left", str(left_margin) + "px")]},
-                {"selector": "tr", "props": [("border-top", "0px")]},
-                {
-                    "selector": "th, td",
-                    "props": [("border", "0px"), ("text-align", "right")],
-                },
-                {"selector": "td", "props": [("padding", "3px 13px")]},
-                {
-                    "selector": "td:nth-child(2), td:nth-child(3)",
-                    "props": [("border-bottom", "1px solid black")],
-                },
-                {
-                    "selector": "tr:last-child td:nth-child(2), tr:last-child td:nth-child(3)",
-                    "props": [("border-bottom", "2px solid black")],
-                },
-                {
-                    "selector": "tr:last-child, tr:nth-last-child(2)",
-                    "props": [("font-weight", "bold")],
-                },
-            ]
+    # Round all numbers to whole hours, except Total FTE with 1 decimal place
+    decimals = [0] * (len(_HOURS_TABLE_ROW_LABELS) - 1) + [1]
+    rows = "".join(
+        f"<tr><td>{label}</td><td>{m:.{d}f}</td><td>{y:.{d}f}</td></tr>"
+        for label, m, y, d in zip(
+            _HOURS_TABLE_ROW_LABELS,
+            hours_for_month.to_numpy(),
+            hours_ytd.to_numpy(),
+            decimals,
         )
     )
-    st.markdown(styled_df.to_html(), unsafe_allow_html=True)
+    st.markdown(
+        _HOURS_TABLE_STYLE
+        + '<table class="hours-table"><thead><tr>'
+        + f"<th></th><th>Month ({month})</th><th>Year to {month}</th>"
+        + f"</tr></thead><tbody>{rows}</tbody></table>",
+        unsafe_allow_html=True,
+    )
 
 
 def contracted_hours_table(stats):
@@ -320,26 +364,32 @@ def contracted_hours_table(stats):
 
 
 def fte_fig(src, budget_fte, group_by_month):
+    st.plotly_chart(
+        _build_fte_fig(src, budget_fte, group_by_month), use_container_width=True
+    )
+
+
+@st.cache_resource(max_entries=32, show_spinner=False, hash_funcs=_DF_VALUES_HASH)
+def _build_fte_fig(src, budget_fte, group_by_month):
     if group_by_month:
         # Groups data by month, show a bar for each year above each month
         df = util.group_data_by_month(src, month_col="month", value_col="total_fte")
-        df.columns = ["Month", "FTE", "Year"]
-        color = "Year"
+        x, color = "Month", "Year"
     else:
-        # Display as normal time series data
-        df = src[["month", "total_fte"]].copy()
-        df = df.sort_values(by=["month"], ascending=[True])
-        df.columns = ["Month", "FTE"]
-        color = None
+        # Display as normal time series data. Axis titles come from labels=
+        # below, so no copy/rename of the source frame is needed.
+        df = src.sort_values(by=["month"], ascending=[True])
+        x, color = "month", None
 
     fig = px.bar(
         df,
-        x="Month",
-        y="FTE",
+        x=x,
+        y="total_fte",
         color=color,
         barmode="group",
-        text="FTE",
+        text="total_fte",
         text_auto=".1f",
+        labels={"month": "Month", "total_fte": "FTE"},
     )
     # Horizontal budget line
     fig.add_hline(
@@ -349,7 +399,7 @@ def fte_fig(src, budget_fte, group_by_month):
     )
     # Text for budget line. Place over last visible month and shift to the right by 80 pixels.
     fig.add_annotation(
-        x=df["Month"].iloc[-1],
+        x=df[x].iloc[-1],
         y=budget_fte,
         xref="x",
         yref="y",
@@ -372,24 +422,33 @@ def fte_fig(src, budget_fte, group_by_month):
             orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1
         ),  # show legend horizontally on top right
     )
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
 def hours_fig(src):
-    df = src[["month", "prod_hrs", "nonprod_hrs", "total_hrs"]].copy()
-    df.columns = [
-        "Month",
-        "Productive",
-        "Non-productive",
-        "Total",
-    ]
-
-    # Convert table with separate columns for prod vs non-prod to having a "Type" column
-    # ie columns of [Month, Prod Hours, Nonprod Hours, Total] -> [Month, Hours, Type (Prod or Nonprod), Total]
-    df = df.melt(id_vars=["Month", "Total"], var_name="Type", value_name="Hours")
-
-    # Finally convert each row to a percent, which is what we'll actually graph
-    df["Percent"] = df["Hours"] / df["Total"]
+    st.plotly_chart(_build_hours_fig(src), use_container_width=True)
+
+
+@st.cache_resource(max_entries=32, show_spinner=False, hash_funcs=_DF_VALUES_HASH)
+def _build_hours_fig(src):
+    # Convert table with separate columns for prod vs non-prod to having a "Type" column,
+    # ie columns of [Month, Prod Hours, Nonprod Hours] -> [Month, Type (Prod or Nonprod), Hours],
+    # along with each row's percent of total hours, which is what we'll actually graph.
+    # Stack the two hours columns directly instead of copy + rename + melt, and
+    # divide by the totals once for both halves.
+    months = src["month"].to_numpy()
+    prod = src["prod_hrs"].to_numpy()
+    nonprod = src["nonprod_hrs"].to_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inv_total = 1.0 / src["total_hrs"].to_numpy()
+    df = pd.DataFrame(
+        {
+            "Month": np.tile(months, 2),
+            "Type": np.repeat(["Productive", "Non-productive"], len(months)),
+            "Hours": np.concatenate([prod, nonprod]),
+            "Percent": np.concatenate([prod * inv_total, nonprod * inv_total]),
+        }
+    )
 
     # Stacked bar graph, one color for each unique value in Type (prod vs non-prod)
     # Also pass the actual Hours in as customdata to use in the hovertemplate
@@ -419,7 +478,7 @@ def hours_fig(src):
     fig.update_layout(
         margin={"t": 25},
     )
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
 def compare_hours_fig(src):
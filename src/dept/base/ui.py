@@ -1,6 +1,7 @@
 import pandas as pd
 import streamlit as st
 from datetime import datetime
+from functools import lru_cache
 from dateutil.relativedelta import relativedelta
 from . import configs, data, figs
 from ... import util, static_data, source_data
@@ -22,36 +23,24 @@ def show_settings(config: configs.DeptConfig, src_data: source_data.SourceData)
         else:
             dept_id = config.wd_ids[0]
 
-        # Get the minimum and maximum months in the data
-        min_month = min(
-            src_data.volumes_df["month"].min(),
-            src_data.hours_df["month"].min(),
-            src_data.income_stmt_df["month"].min(),
-        )
-        max_month = min(
-            src_data.volumes_df["month"].max(),
-            src_data.hours_df["month"].max(),
-            src_data.income_stmt_df["month"].max(),
-        )
+        # Get the minimum and maximum months in the data, precomputed at load time
+        min_month, max_month = src_data.month_range
         month = st.selectbox(
             label="Month",
             options=_enumerate_months(min_month, max_month),
-            format_func=lambda m: datetime.strptime(m, "%Y-%m").strftime("%b %Y"),
+            format_func=util.YYYY_MM_to_month_str,
         )
 
+        # Section selector. "All" shows the full page; picking one section
+        # skips building the others' figures and tables entirely on reruns.
         st.subheader("Sections")
-        st.markdown(
-            "\n".join(
-                [
-                    "* [KPIs](#kpis)",
-                    "* [Volumes](#volumes)",
-                    "* [Hours/FTE](#hours)",
-                    "* [Income Statment](#income)",
-                ]
-            )
+        section = st.radio(
+            label="Sections",
+            label_visibility="collapsed",
+            options=["All", "KPIs", "Volumes", "Hours/FTE", "Income Statement"],
         )
 
-    return {"dept_id": dept_id, "month": month}
+    return {"dept_id": dept_id, "month": month, "section": section}
 
 
 def show(config: configs.DeptConfig, settings: dict, data: data.DeptData):
@@ -66,39 +55,35 @@ def show(config: configs.DeptConfig, settings: dict, data: data.DeptData):
     else:
         st.title(f"{config.name}")
 
-    # Main content
-    kpi_month_str = datetime.strptime(s["kpi_month_max"], "%Y-%m").strftime("%b %Y")
-    st.header(
-        f"Key Performance Indicators, Year to {kpi_month_str}",
-        anchor="kpis",
-        divider="gray",
-    )
-    st.caption("\* Unit of Service (UOS) is " + s["uos_unit"])
-    _show_kpi(settings, data)
-    st.header("Volumes", anchor="volumes", divider="gray")
-    st.caption("\* Volume unit is " + s["volume_unit"] + "  \n\* Unit of Service (UOS) is " + s["uos_unit"])
-    _show_volumes(settings, data)
-    st.header("Hours and FTE", anchor="hours", divider="gray")
-    _show_hours(settings, data)
-    month_str = datetime.strptime(settings["month"], "%Y-%m").strftime("%b %Y")
-    st.header(f"Income Statement - {month_str}", anchor="income", divider="gray")
-    _show_income_stmt(settings, data)
+    # Main content. Only render the sections the sidebar selector asks for, so
+    # focusing one section skips constructing the others' figures and grid.
+    section = settings.get("section", "All")
+    if section in ("All", "KPIs"):
+        kpi_month_str = util.YYYY_MM_to_month_str(s["kpi_month_max"])
+        st.header(
+            f"Key Performance Indicators, Year to {kpi_month_str}",
+            anchor="kpis",
+            divider="gray",
+        )
+        st.caption("\* Unit of Service (UOS) is " + s["uos_unit"])
+        _show_kpi(settings, data)
+    if section in ("All", "Volumes"):
+        st.header("Volumes", anchor="volumes", divider="gray")
+        st.caption("\* Volume unit is " + s["volume_unit"] + "  \n\* Unit of Service (UOS) is " + s["uos_unit"])
+        _show_volumes(settings, data)
+    if section in ("All", "Hours/FTE"):
+        st.header("Hours and FTE", anchor="hours", divider="gray")
+        _show_hours(settings, data)
+    if section in ("All", "Income Statement"):
+        month_str = util.YYYY_MM_to_month_str(settings["month"])
+        st.header(f"Income Statement - {month_str}", anchor="income", divider="gray")
+        _show_income_stmt(settings, data)
 
 
 def _show_kpi(settings: dict, data: data.DeptData):
     s = data.stats
 
-    if all(
-        s == 0
-        for s in [
-            s["revenue_per_volume"],
-            s["target_revenue_per_volume"],
-            s["expense_per_volume"],
-            s["target_expense_per_volume"],
-            s["hours_per_volume"],
-            s["fte_variance"],
-        ]
-    ):
+    if s["no_kpi_data"]:
         return st.write("No data for department")
 
     col1, col2, col3, col4 = st.columns([2, 2, 2, 8])
@@ -146,15 +131,7 @@ def _show_kpi(settings: dict, data: data.DeptData):
 
 def _show_volumes(settings: dict, data: data.DeptData):
 
-    if all(
-        s == 0
-        for s in [
-            data.stats["month_volume"],
-            data.stats["month_budget_volume"],
-            data.stats["ytm_volume"],
-            data.stats["ytm_budget_volume"],
-        ]
-    ):
+    if data.stats["no_volume_data"]:
         return st.write("No data for department")
 
     month = util.YYYY_MM_to_month_str(settings["month"])
@@ -207,7 +184,7 @@ def _show_hours(settings: dict, data: data.DeptData):
 
     # Show productive / non-productive hours for month
     col1, col2 = st.columns(2)
-    if data.hours_for_month is None or data.hours_for_month.shape[0] == 0:
+    if data.stats["no_hours_data"]:
         st.write("No data for this month")
     else:
         with col1:
@@ -261,7 +238,10 @@ def _dept_name(key):
     return static_data.WDID_TO_DEPT_NAME.get(key, f"Unknown Department {key}")
 
 
+@lru_cache(maxsize=64)
 def _enumerate_months(min_month, max_month):
+    # Pure in its arguments, so cache the month list across Streamlit reruns
+    # instead of re-walking the range on every widget interaction
     min_month = datetime.strptime(min_month, "%Y-%m")
     cur_month = datetime.strptime(max_month, "%Y-%m")
     months = []
@@ -278,6 +258,9 @@ def _filter_by_period(df, period_str, col="month"):
     """
     # Filter based on first and last date. Treat None values as no filter.
     first_month, last_month = util.period_str_to_month_strs(period_str)
+    if first_month and last_month:
+        # All named periods have both bounds; filter in a single pass
+        return df[df[col].between(first_month, last_month)]
     if first_month:
         df = df[df.loc[:, col] >= first_month]
     if last_month:
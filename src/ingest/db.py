@@ -1,8 +1,20 @@
+import os
 import logging
+import sqlite3
+import numpy as np
+import pandas as pd
 from datetime import datetime
+from sqlalchemy import create_engine, exc, text
 from sqlalchemy.orm import Session
 from src.model import Base, Metadata, SourceMetadata
 
+# Teach sqlite3 to bind the numpy/pandas scalar types that come out of
+# DataFrame.itertuples. Timestamps use the same string format SQLAlchemy's
+# SQLite dialect writes for DateTime columns.
+sqlite3.register_adapter(np.int64, int)
+sqlite3.register_adapter(np.int32, int)
+sqlite3.register_adapter(pd.Timestamp, lambda ts: ts.strftime("%Y-%m-%d %H:%M:%S.%f"))
+
 
 def create_schema(engine):
     """
@@ -11,37 +23,82 @@ def create_schema(engine):
     Base.metadata.create_all(engine)
 
 
+def get_source_hashes(db_file):
+    """
+    Return the {filename: sha256} mapping recorded by the last ingest into db_file,
+    or an empty dict if the database doesn't exist or has no source metadata
+    """
+    if not os.path.isfile(db_file):
+        return {}
+    engine = create_engine(f"sqlite:///{db_file}")
+    try:
+        with Session(engine) as session:
+            return {row.filename: row.sha256 for row in session.query(SourceMetadata)}
+    except exc.SQLAlchemyError:
+        return {}
+    finally:
+        engine.dispose()
+
+
+def get_source_modified_times(db_file):
+    """
+    Return the {filename: modified} mapping recorded by the last ingest into db_file,
+    or an empty dict if the database doesn't exist or has no source metadata.
+    Modified times are returned as Unix epoch seconds so callers can compare them
+    directly against st_mtime values without building datetime objects per file.
+    """
+    if not os.path.isfile(db_file):
+        return {}
+    engine = create_engine(f"sqlite:///{db_file}")
+    try:
+        with Session(engine) as session:
+            return {
+                row.filename: row.modified.timestamp()
+                for row in session.query(SourceMetadata)
+            }
+    except exc.SQLAlchemyError:
+        return {}
+    finally:
+        engine.dispose()
+
+
 def clear_table_and_insert_data(session, table, df, df_column_order=None):
     """
     Deletes rows from the given table and reinsert data from dataframe
     table is a SQLAlchemy mapped class
+    df may also be a list of dataframes with identical columns, which are inserted
+    one at a time so a combined frame never has to be materialized
     df_column_order specifies the names of the columns in df so they match the order of the table's SQLAlchemy definition
     """
-    # Clear data in DB table
-    session.query(table).delete()
-    session.commit()
+    # Clear data in DB table with a plain DELETE (no WHERE clause), which SQLite
+    # handles with its truncate optimization instead of row-by-row ORM deletion.
+    # The caller commits all table loads as one transaction.
+    session.execute(text(f"DELETE FROM {table.__tablename__}"))
 
-    # Reorder columns to match SQLAlchema table definition
-    if df_column_order is not None:
-        df = df[df_column_order]
-
-    # Load data into table using Pandas to_sql
+    # Load data with executemany on the underlying sqlite3 connection using a
+    # parameterized INSERT. This binds row values directly instead of having
+    # pandas render multi-row SQL strings for SQLite to reparse per chunk.
     logging.info(f"Loading table {table}")
-    df.to_sql(
-        table.__tablename__,
-        con=session.bind,
-        index=False,
-        if_exists="append",
-    )
+    dbapi_conn = session.connection().connection
+    for frame in df if isinstance(df, list) else [df]:
+        # Reorder columns to match SQLAlchemy table definition
+        if df_column_order is not None:
+            frame = frame[df_column_order]
+        cols = ", ".join(frame.columns)
+        placeholders = ", ".join(["?"] * len(frame.columns))
+        sql = f"INSERT INTO {table.__tablename__} ({cols}) VALUES ({placeholders})"
+        dbapi_conn.executemany(sql, frame.itertuples(index=False, name=None))
 
 
-def update_meta(engine, modified, contracted_hours_updated_month):
+def update_meta(engine, modified, hashes, contracted_hours_updated_month):
     """
-    Populate the sources_meta table with metadata for the source files
+    Populate the sources_meta table with metadata for the source files.
+    modified maps each source filename to its st_mtime in Unix epoch seconds, and
+    hashes maps it to the sha256 digest of its contents.
     """
     # Write timestamps to DB
     logging.info("Writing metadata")
-    with Session(engine) as session:
+    with Session(engine, autoflush=False, expire_on_commit=False) as session:
         # Clear metadata tables
         session.query(Metadata).delete()
         session.query(SourceMetadata).delete()
@@ -56,8 +113,12 @@ def update_meta(engine, modified, contracted_hours_updated_month):
         )
 
         # Store last modified timestamps for ingested files
-        for file, modified_time in modified.items():
-            source_metadata = SourceMetadata(filename=file, modified=modified_time)
+        for file, mtime in modified.items():
+            source_metadata = SourceMetadata(
+                filename=file,
+                modified=datetime.fromtimestamp(mtime),
+                sha256=hashes.get(file),
+            )
             session.add(source_metadata)
 
         session.commit()
@@ -1,5 +1,9 @@
+import concurrent.futures
+import os
 import re
 import logging
+import numpy as np
+import openpyxl
 import pandas as pd
 from datetime import datetime, timedelta
 from .. import util, static_data
@@ -12,14 +16,54 @@ PAY_PERIOD_ANCHOR_DATE = {
     "start_date": datetime(2022, 12, 17),
 }
 
+# Prefer the Rust-based calamine engine for pd.read_excel when available; it parses
+# xlsx files several times faster than openpyxl. Fall back to openpyxl if not installed.
+try:
+    import python_calamine  # noqa: F401
 
-def read_volume_and_uos_data(filename, sheet):
+    _EXCEL_ENGINE = "calamine"
+except ImportError:
+    _EXCEL_ENGINE = "openpyxl"
+
+# Lowercased dept alias -> workday ID lookup, precomputed once at module load so
+# per-file readers don't rebuild the dict for every workbook
+_ALIASES_LC_TO_WDID = {k.lower(): v for k, v in static_data.ALIASES_TO_WDID.items()}
+
+
+def open_excel_file(filename):
+    """
+    Open an Excel workbook for reading several sheets through _read_excel_sheet.
+    Opening once amortizes the ZIP decompression and workbook metadata parse across
+    all sheet reads - significant for the large Dashboard Supporting Data file.
+    """
+    return pd.ExcelFile(filename, engine=_EXCEL_ENGINE)
+
+
+def _read_excel_sheet(workbook, sheet):
+    """
+    Read one worksheet into a dataframe with no header row, like pd.read_excel(..., header=None).
+    workbook is either a filename or a pd.ExcelFile from open_excel_file(), so callers that
+    read several sheets from the same file can open it just once.
     """
-    Read the Excel sheet with volume data into a dataframe
+    xl = workbook
+    if not isinstance(workbook, pd.ExcelFile):
+        xl = open_excel_file(workbook)
+    try:
+        return xl.parse(sheet, header=None)
+    finally:
+        # Only close files opened here; leave caller-provided ones open
+        if xl is not workbook:
+            xl.close()
+
+
+def read_volume_and_uos_data(workbook, sheet):
+    """
+    Read the Excel sheet with volume data into a dataframe.
+    workbook is a filename or an opened pd.ExcelFile (see _read_excel_sheet).
     """
     # Read tables from excel worksheet
-    logging.info(f"Reading {filename}, {sheet}")
-    xl_data = pd.read_excel(filename, sheet_name=sheet, header=None)
+    logging.info(f"Reading sheet {sheet}")
+    xl_data = _read_excel_sheet(workbook, sheet)
     volumes_by_year = util.df_get_tables_by_columns(xl_data, "1:70")
 
     # Convert from multiple tables:
@@ -45,41 +89,54 @@ def read_volume_and_uos_data(filename, sheet):
         col_offset = 0 if pd.notna(df.iloc[year_row, year_col]) else 1
         year = df.iloc[year_row, year_col + col_offset]
         assert pd.notna(year)
+        # Numeric cells may come back as floats depending on the Excel engine
+        year = int(year)
+
+        # Skip header rows x 2 with year and month names. Keep the dept ID and name columns (A:B)
+        # plus up to 12 month columns. Most tables have two non-data columns preceding data;
+        # col_offset above gives us the number of extra non-data columns in this table.
+        month_cols = list(range(2 + col_offset, min(2 + col_offset + 12, df.shape[1])))
+        df = df.iloc[2:, [0, 1] + month_cols]
+        df.columns = ["dept_wd_id", "dept_name"] + list(
+            range(1, len(month_cols) + 1)
+        )
 
-        # Skip header rows x 2 with year and month names
-        df = df.iloc[2:]
-
-        # Pull volume data from each row
-        for _index, row in df.iterrows():
-            # Dept ID and name in the A:B
-            dept_wd_id = row.iloc[0]
-            dept_name = row.iloc[1]
-
-            # Volume unit for this dept
-            unit = dept_id_to_unit.get(dept_wd_id, None)
-
-            # Iterate over volume numbers in columns C:N. enumerate(..., start=1) results in month = [1..12]
-            # Most tables have two non-data columns preceding data. col_offset above gives us the number of
-            # extra non-data columns in this table
-            volumes = row.iloc[2 + col_offset : 2 + col_offset + 12]
-            for month_num, volume in enumerate(volumes, start=1):
-                if pd.notnull(volume):
-                    # Format month column like "2022-01"
-                    month = f"{year:04d}-{month_num:02d}"
-                    data.append([dept_wd_id, dept_name, month, volume, unit])
-
-    return pd.DataFrame(
-        data, columns=["dept_wd_id", "dept_name", "month", "volume", "unit"]
-    )
+        # Unpivot the month columns into one row per (dept, month) and drop empty cells
+        melted = df.melt(
+            id_vars=["dept_wd_id", "dept_name"],
+            var_name="month_num",
+            value_name="volume",
+        ).dropna(subset=["volume"])
+
+        # Format month column like "2022-01" as a categorical built directly from
+        # the month numbers: each month number is a 0-based code into the 12
+        # precomputed labels, so no per-value dict lookup and each label string is
+        # stored once. Map each dept to its volume unit.
+        month_strs = [f"{year:04d}-{m:02d}" for m in range(1, 13)]
+        melted["month"] = pd.Categorical.from_codes(
+            melted["month_num"].to_numpy(dtype=np.intp) - 1, categories=month_strs
+        )
+        melted["unit"] = melted["dept_wd_id"].map(dept_id_to_unit)
+        data.append(
+            melted[["dept_wd_id", "dept_name", "month", "volume", "unit"]]
+        )
+
+    df = pd.concat(data, ignore_index=True)
+
+    # Dictionary-encode the heavily repeated department strings
+    df["dept_wd_id"] = df["dept_wd_id"].astype("category")
+    df["dept_name"] = df["dept_name"].astype("category")
+    return df
 
 
-def read_budget_data(filename, budget_sheet, hrs_per_volume_sheet, uos_sheet):
+def read_budget_data(workbook, budget_sheet, hrs_per_volume_sheet, uos_sheet):
     """
-    Read the sheet from the Dashboard Supporting Data Excel workbook with budgeted hours and volume data into a dataframe
+    Read the sheet from the Dashboard Supporting Data Excel workbook with budgeted hours and volume data into a dataframe.
+    workbook is a filename or an opened pd.ExcelFile (see _read_excel_sheet).
     """
     # Extract table and assign column names that match DB schema for columns we will retain
-    logging.info(f"Reading {filename}, {budget_sheet}")
-    xl_data = pd.read_excel(filename, sheet_name=budget_sheet, header=None)
+    logging.info(f"Reading sheet {budget_sheet}")
+    xl_data = _read_excel_sheet(workbook, budget_sheet)
     budget_df = util.df_get_tables_by_rows(
         xl_data, cols="B:K", start_row_idx=6, limit=1
     )
@@ -98,14 +155,14 @@ def read_budget_data(filename, budget_sheet, hrs_per_volume_sheet, uos_sheet):
     ]
 
     # Read goal Prod hrs / UOS from dedicated sheet
-    logging.info(f"Reading {filename}, {hrs_per_volume_sheet}")
-    xl_data = pd.read_excel(filename, sheet_name=hrs_per_volume_sheet, header=None)
+    logging.info(f"Reading sheet {hrs_per_volume_sheet}")
+    xl_data = _read_excel_sheet(workbook, hrs_per_volume_sheet)
     hrs_per_volume_df = util.df_get_table(xl_data, start_cell="A2", has_header_row=True)
 
     # Temporarily using prior year data for budgeted UOS.
     # Pull second table from UOS sheet and keep first (WD ID) and last (total) columns
-    logging.info(f"Reading {filename}, {uos_sheet}")
-    xl_data = pd.read_excel(filename, sheet_name=uos_sheet, header=None)
+    logging.info(f"Reading sheet {uos_sheet}")
+    xl_data = _read_excel_sheet(workbook, uos_sheet)
     prior_yr_uos_df = util.df_get_table(xl_data, start_cell="R3", has_header_row=False)
     prior_yr_uos_df = prior_yr_uos_df.iloc[:, [0, -1]]
     prior_yr_uos_df.columns = ["ID", "budget_uos"]
@@ -141,13 +198,14 @@ def read_budget_data(filename, budget_sheet, hrs_per_volume_sheet, uos_sheet):
     ]
 
 
-def read_contracted_hours_data(filename, sheet):
+def read_contracted_hours_data(workbook, sheet):
     """
-    Read sheet from the Dashboard Supporting Data Excel workbook with Traveler's Hours
+    Read sheet from the Dashboard Supporting Data Excel workbook with Traveler's Hours.
+    workbook is a filename or an opened pd.ExcelFile (see _read_excel_sheet).
     """
     # Extract table
-    logging.info(f"Reading {filename}, {sheet}")
-    xl_data = pd.read_excel(filename, sheet_name=sheet, header=None)
+    logging.info(f"Reading sheet {sheet}")
+    xl_data = _read_excel_sheet(workbook, sheet)
     contracted_hours_updated_month = util.df_get_val_or_range(xl_data, "G1")
     xl_df = util.df_get_table(xl_data, start_cell="A4", has_header_row=True)
 
@@ -171,18 +229,18 @@ def read_contracted_hours_data(filename, sheet):
     #   ID, dept_name, YYYY_hrs, YYYY_ttl, YYYY_pct
     # to:
     #   ID, dept_name, year, hours, pct
-    df = pd.DataFrame(
-        columns=["dept_wd_id", "dept_name", "year", "hrs", "ttl_dept_hrs"]
-    )
-    for idx, row in xl_df.iterrows():
-        for year in years:
-            df.loc[len(df)] = {
-                "dept_wd_id": row["dept_wd_id"],
-                "dept_name": row["dept_name"],
-                "year": year,
-                "hrs": row[f"{year}_hrs"],
-                "ttl_dept_hrs": row[f"{year}_ttl"],
-            }
+    data = []
+    for year in years:
+        year_df = xl_df[["dept_wd_id", "dept_name", f"{year}_hrs", f"{year}_ttl"]]
+        year_df.columns = ["dept_wd_id", "dept_name", "hrs", "ttl_dept_hrs"]
+        year_df["year"] = year
+        data.append(year_df)
+    df = pd.concat(data, ignore_index=True)
+    df = df[["dept_wd_id", "dept_name", "year", "hrs", "ttl_dept_hrs"]]
+
+    # Dictionary-encode the heavily repeated department strings
+    df["dept_wd_id"] = df["dept_wd_id"].astype("category")
+    df["dept_name"] = df["dept_name"].astype("category")
 
     # Interpret NaN as 0 for total hours
     df["ttl_dept_hrs"] = df["ttl_dept_hrs"].fillna(0)
@@ -190,36 +248,125 @@ def read_contracted_hours_data(filename, sheet):
     return contracted_hours_updated_month, df
 
 
+def _cached_parse(file, parser):
+    """
+    Parse one Excel workbook with parser(file), caching the resulting dataframe as a
+    Parquet file next to the source. Historical workbooks never change once published,
+    so on later ingests (eg after a single new month arrives) the cached frame loads in
+    milliseconds instead of reparsing the xlsx. Cache files are dot-prefixed, which the
+    data directory scan already filters out. Any cache problem (missing pyarrow,
+    unreadable or stale file) silently falls back to parsing the workbook.
+    """
+    dirname, basename = os.path.split(file)
+    cache_file = os.path.join(dirname, f".{basename}.parquet")
+    try:
+        if os.path.getmtime(cache_file) >= os.path.getmtime(file):
+            return pd.read_parquet(cache_file)
+    except Exception:
+        pass
+    df = parser(file)
+    try:
+        df.to_parquet(cache_file)
+    except Exception:
+        logging.debug(f"Could not write parse cache: {cache_file}")
+    return df
+
+
 def read_income_stmt_data(files):
     """
-    Read and combine data from Excel workbooks for income statements, which are per month
+    Read data from Excel workbooks for income statements, which are per month.
+    Each workbook is independent, so parse them in parallel across worker processes to
+    spread the CPU-bound Excel parsing over available cores.
+    Returns a list of dataframes, one per file, so the caller can stream them into the
+    DB without ever materializing the combined multi-year frame.
     """
-    ret = []
-    for file in files:
-        # Extract data from first and only worksheet
-        # Keep the first 4 columns, Ledger Account, Cost Center, Spend Category, and Revenue Category
-        # Keep the actual and budget columns for the month (E:F) and year (L:M)
-        logging.info(f"Reading {file}")
-        xl_data = pd.read_excel(file, header=None, usecols="A:D,E:F,L:M")
-
-        # There are a couple formats of these files - 2023 files have metadata in the first few rows,
-        # but older ones don't. First, find cell with the value of "Ledger Account", which is always
-        # in the upper left of the table.
-        (row_start, _col) = util.df_find_by_column(xl_data, "Ledger Account")
-
-        # Get the month from the row above the table, column E, which should read "Month to Date: <MM/YYYY>"
-        # Convert it to the format YYYY-MM
-        # Also, row_idx is 0-based, so to get the row above, just pass in row_idx
-        month = util.df_get_val_or_range(xl_data, f"E{row_start}")
-        month = datetime.strptime(month, "Month to Date: %m/%Y")
-        month = month.strftime("%Y-%m")
-
-        # Drop the non-data rows and rename columns
-        income_stmt_df = xl_data.iloc[row_start:]
-        income_stmt_df = income_stmt_df.iloc[1:].reset_index(drop=True)
-        income_stmt_df.columns = [
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        return list(executor.map(_read_one_income_stmt_cached, files, chunksize=4))
+
+
+def _read_one_income_stmt_cached(file):
+    return _cached_parse(file, _read_one_income_stmt)
+
+
+def _read_one_income_stmt(file):
+    """
+    Read income statement data for one month from a single Excel workbook
+    """
+    # Extract data from first and only worksheet in a single streaming pass over the rows.
+    # Keep the first 4 columns, Ledger Account, Cost Center, Spend Category, and Revenue Category
+    # Keep the actual and budget columns for the month (E:F) and year (L:M)
+    logging.info(f"Reading {file}")
+    wb = openpyxl.load_workbook(file, read_only=True, data_only=True)
+    try:
+        # Limit the read to columns A:M so cells beyond the table (N:Q notes etc)
+        # are never materialized; iter_rows pads short rows out to max_col
+        rows = [
+            row[0:6] + row[11:13]
+            for row in wb.active.iter_rows(max_col=13, values_only=True)
+        ]
+    finally:
+        wb.close()
+
+    # There are a couple formats of these files - 2023 files have metadata in the first few rows,
+    # but older ones don't. First, find the row starting with "Ledger Account", which is always
+    # in the upper left of the table.
+    row_start = next(i for i, row in enumerate(rows) if row[0] == "Ledger Account")
+
+    # Get the month from the row above the table, column E, which should read "Month to Date: <MM/YYYY>"
+    # Convert it to the format YYYY-MM
+    month = rows[row_start - 1][4]
+    month = datetime.strptime(month, "Month to Date: %m/%Y")
+    month = month.strftime("%Y-%m")
+
+    # Drop the non-data rows and assign column names
+    income_stmt_df = pd.DataFrame(rows[row_start + 1 :])
+    income_stmt_df.columns = [
+        "ledger_acct",
+        "Cost Center",
+        "spend_category",
+        "revenue_category",
+        "actual",
+        "budget",
+        "actual_ytd",
+        "budget_ytd",
+    ]
+
+    # Add a new column "dept_wd_id" converting the Cost Center to an ID. Drop rows without a known workday dept ID
+    # Reassign canonical dept names from workday ID into the dept_name column
+    income_stmt_df["dept_wd_id"] = (
+        income_stmt_df["Cost Center"].str.lower().map(_ALIASES_LC_TO_WDID)
+    )
+    unrecognized = (
+        income_stmt_df[income_stmt_df["dept_wd_id"].isna()]
+        .loc[:, "Cost Center"]
+        .unique()
+    )
+    income_stmt_df.dropna(subset=["dept_wd_id"], inplace=True)
+    income_stmt_df["dept_name"] = income_stmt_df["dept_wd_id"].map(
+        static_data.WDID_TO_DEPT_NAME
+    )
+
+    # Log unrecognized cost centers that were dropped from data:
+    if len(unrecognized) > 0 and unrecognized[0] != "(Blank)":
+        logging.warn(
+            f"Dropping unknown cost centers from income statement: {unrecognized} in {file}"
+        )
+
+    # Add the month as a column
+    income_stmt_df["month"] = month
+
+    # Replace "(Blank)" with an actual empty string. Only the category columns
+    # contain it, so don't scan the numeric columns
+    for col in ("spend_category", "revenue_category"):
+        income_stmt_df[col] = income_stmt_df[col].replace("(Blank)", "")
+
+    # Reorder and retain columns corresponding to DB table
+    return income_stmt_df[
+        [
+            "month",
             "ledger_acct",
-            "Cost Center",
+            "dept_wd_id",
+            "dept_name",
             "spend_category",
             "revenue_category",
             "actual",
@@ -227,85 +374,35 @@ def read_income_stmt_data(files):
             "actual_ytd",
             "budget_ytd",
         ]
-
-        # Add a new column "dept_wd_id" converting the Cost Center to an ID. Drop rows without a known workday dept ID
-        # Reassign canonical dept names from workday ID into the dept_name column
-        income_stmt_df["dept_wd_id"] = (
-            income_stmt_df["Cost Center"]
-            .str.lower()
-            .map({k.lower(): v for k, v in static_data.ALIASES_TO_WDID.items()})
-        )
-        unrecognized = (
-            income_stmt_df[income_stmt_df["dept_wd_id"].isna()]
-            .loc[:, "Cost Center"]
-            .unique()
-        )
-        income_stmt_df.dropna(subset=["dept_wd_id"], inplace=True)
-        income_stmt_df["dept_name"] = income_stmt_df["dept_wd_id"].map(
-            static_data.WDID_TO_DEPT_NAME
-        )
-
-        # Log unrecognized cost centers that were dropped from data:
-        if len(unrecognized) > 0 and unrecognized[0] != "(Blank)":
-            logging.warn(
-                f"Dropping unknown cost centers from income statement: {unrecognized} in {file}"
-            )
-
-        # Add the month as a column
-        income_stmt_df["month"] = month
-
-        # Replace all cells with "(Blank)" with actual empty string.
-        income_stmt_df = income_stmt_df.replace("(Blank)", "")
-
-        # Reorder and retain columns corresponding to DB table
-        ret.append(
-            income_stmt_df[
-                [
-                    "month",
-                    "ledger_acct",
-                    "dept_wd_id",
-                    "dept_name",
-                    "spend_category",
-                    "revenue_category",
-                    "actual",
-                    "budget",
-                    "actual_ytd",
-                    "budget_ytd",
-                ]
-            ]
-        )
-
-    return pd.concat(ret)
+    ]
 
 
 def read_historical_hours_and_fte_data(filename, year):
     """
-    Read historical hours/FTE data from the custom formatted Excel workbook
+    Read historical hours/FTE data from the custom formatted Excel workbook.
+    Returns a list of dataframes, one per pay period table, so the caller can combine
+    them with the per-pay-period data in a single concat.
     """
     # Extract data from first and only worksheet
     logging.info(f"Reading {filename}")
-    xl_data = pd.read_excel(filename, header=None, usecols="A,B,C,D,G,M,N,AB")
+    xl_data = pd.read_excel(filename, header=None, usecols="A,B,C,D,G,M,N,AB", engine=_EXCEL_ENGINE)
+
+    # Locate all tables in one vectorized pass instead of rescanning the sheet per
+    # table: each table starts at a "PAY PERIOD" cell in column A and ends at the
+    # first "TOTAL" cell in column B after it
+    col_a = xl_data.iloc[:, 0].astype(str).to_numpy()
+    col_b = xl_data.iloc[:, 1].astype(str).to_numpy()
+    table_starts = np.flatnonzero(col_a == "PAY PERIOD")
+    total_rows = np.flatnonzero(col_b == "TOTAL")
+    table_ends = total_rows[np.searchsorted(total_rows, table_starts)]
 
     # Loop over tables in worksheet, each one representing a pay period
     ret = []
-    last_table_end = 0
-    while True:
-        # Locate the next table by finding the cell containing "PAY PERIOD" in column A
-        table_start = util.df_find_by_column(
-            xl_data, "PAY PERIOD", start_cell=f"A{last_table_end+1}"
-        )
-        if table_start is None:
-            break
-
-        # Locate end of the table by finding the cell containing "TOTAL" in column B
-        row_start = table_start[0]
-        (row_end, _col) = util.df_find_by_column(
-            xl_data, "TOTAL", start_cell=f"B{row_start+1}"
-        )
-        last_table_end = row_end + 1
-
-        # Extract table without 4 header rows or last 3 total rows
-        hours_df = xl_data.iloc[row_start + 4 : row_end - 2].copy()
+    for row_start, row_end in zip(table_starts, table_ends):
+        # Extract table without 4 header rows or last 3 total rows. No defensive
+        # copy needed: under copy-on-write, assigning columns below never writes
+        # through to xl_data, so each table slice stays a cheap view until modified.
+        hours_df = xl_data.iloc[row_start + 4 : row_end - 2]
         hours_df.columns = [
             "Department Number",
             "Department Name",
@@ -318,7 +415,7 @@ def read_historical_hours_and_fte_data(filename, year):
         ]
 
         # Add the pay period number in the format YYYY-##
-        pp_num = xl_data.at[row_start + 1, 0]
+        pp_num = int(xl_data.at[row_start + 1, 0])
         pp_end_date = xl_data.at[row_start + 1, 1]
         hours_df["pay_period"] = f"{year}-{pp_num:02d}"
 
@@ -331,9 +428,7 @@ def read_historical_hours_and_fte_data(filename, year):
 
         # Add a new column "dept_wd_id" using dict, and drop rows without a known workday dept ID
         hours_df["dept_wd_id"] = (
-            hours_df["Department Name"]
-            .str.lower()
-            .map({k.lower(): v for k, v in static_data.ALIASES_TO_WDID.items()})
+            hours_df["Department Name"].str.lower().map(_ALIASES_LC_TO_WDID)
         )
         hours_df.dropna(subset=["dept_wd_id"], inplace=True)
         # Reassign canonical dept names from workday ID using dict
@@ -358,95 +453,99 @@ def read_historical_hours_and_fte_data(filename, year):
             ]
         )
 
-    # Join all the tables and calculate the start date for each pay period number
-    df = pd.concat(ret)
-    df = _add_pay_period_start_date(df)
-    return df
+    return ret
 
 
 def read_hours_and_fte_data(files):
     """
-    Read and combine data from per-month Excel workbooks for productive vs non-productive hours and total FTE
+    Read data from per-month Excel workbooks for productive vs non-productive hours and total FTE.
+    There is a PP#n YYYY Payroll_Productivity_by_Cost_Center.xlsx file for each pay period; each file is
+    independent, so parse them in parallel across worker processes.
+    Returns a list of dataframes, one per file, so the caller can combine them with the
+    historical data in a single concat.
     """
-    # There is a PP#n YYYY Payroll_Productivity_by_Cost_Center.xlsx file for each pay period
-    ret = []
-    for file in files:
-        # Extract data from first and only worksheet
-        logging.info(f"Reading {file}")
-        xl_data = pd.read_excel(file, header=None)
-
-        # Drop any metadata rows prior to start of table, which has the "Department Number" header in the top left.
-        (row_start, _col) = util.df_find_by_column(xl_data, "Department Number")
-        hours_df = xl_data.iloc[row_start:]
-        hours_df = util.df_convert_first_row_to_column_names(hours_df)
-        hours_df.columns.values[2] = "reg_hrs"
-        hours_df.columns.values[3] = "CALLBK - CALLBACK"
-        hours_df.columns.values[4] = "DBLTME - DOUBLETIME"
-        hours_df.columns.values[6] = "OT_1.5 - OVERTIME"
-
-        # Drop next row, which are sub-headers. Find columns by name, because there are
-        # a couple different formats with different columns orders.
-        hours_df = hours_df.loc[1:]
-
-        # Read year and pay period number from file name
-        year_pp_num = re.search(r"PP#(\d+) (\d+) ", file, re.IGNORECASE)
-        year = year_pp_num.group(2)
-        pp_num = int(year_pp_num.group(1))
-        hours_df["pay_period"] = f"{year}-{pp_num:02d}"
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        return list(executor.map(_read_one_hours_file_cached, files, chunksize=4))
 
-        # Transform
-        # ---------
-        # Sum overtime/double and premium hours all into overtime_hrs
-        hours_df["overtime_hrs"] = (
-            hours_df["DBLTME - DOUBLETIME"] + hours_df["OT_1.5 - OVERTIME"]
-        )
 
-        # Add a new column "dept_wd_id" using dict, and drop rows without a known workday dept ID
-        hours_df["dept_wd_id"] = (
-            hours_df["Department Name"]
-            .str.lower()
-            .map({k.lower(): v for k, v in static_data.ALIASES_TO_WDID.items()})
-        )
-        hours_df.dropna(subset=["dept_wd_id"], inplace=True)
-        # Reassign canonical dept names from workday ID using dict
-        hours_df["dept_name"] = hours_df["dept_wd_id"].map(
-            static_data.WDID_TO_DEPT_NAME
-        )
+def _read_one_hours_file_cached(file):
+    return _cached_parse(file, _read_one_hours_file)
 
-        # Rename and specific relevant columns to retain
-        hours_df.rename(
-            columns={
-                "Regular Hours": "reg_hrs",
-                "Total Productive Hours": "prod_hrs",
-                "Total Non-Productive Hours": "nonprod_hrs",
-                "Total Productive/Non-Productive Hours": "total_hrs",
-                "Total FTE": "total_fte",
-            },
-            inplace=True,
-        )
-        ret.append(
-            hours_df[
-                [
-                    "pay_period",
-                    "dept_wd_id",
-                    "dept_name",
-                    "reg_hrs",
-                    "overtime_hrs",
-                    "prod_hrs",
-                    "nonprod_hrs",
-                    "total_hrs",
-                    "total_fte",
-                ]
-            ]
-        )
 
-    # Join all the tables and calculate the start date for each pay period number
-    df = pd.concat(ret)
-    df = _add_pay_period_start_date(df)
-    return df
+def _read_one_hours_file(file):
+    """
+    Read productive/non-productive hours and FTE data for one pay period from a single Excel workbook
+    """
+    # Extract data from first and only worksheet
+    logging.info(f"Reading {file}")
+    xl_data = pd.read_excel(file, header=None, engine=_EXCEL_ENGINE)
+
+    # Drop any metadata rows prior to start of table, which has the "Department Number" header in the top left.
+    (row_start, _col) = util.df_find_by_column(xl_data, "Department Number")
+    hours_df = xl_data.iloc[row_start:]
+    hours_df = util.df_convert_first_row_to_column_names(hours_df)
+    # Assign a new columns list - the existing Index can't be written in place
+    cols = list(hours_df.columns)
+    cols[2] = "reg_hrs"
+    cols[3] = "CALLBK - CALLBACK"
+    cols[4] = "DBLTME - DOUBLETIME"
+    cols[6] = "OT_1.5 - OVERTIME"
+    hours_df.columns = cols
+
+    # Drop next row, which are sub-headers. Find columns by name, because there are
+    # a couple different formats with different columns orders.
+    hours_df = hours_df.loc[1:]
+
+    # Read year and pay period number from file name
+    year_pp_num = re.search(r"PP#(\d+) (\d+) ", file, re.IGNORECASE)
+    year = year_pp_num.group(2)
+    pp_num = int(year_pp_num.group(1))
+    hours_df["pay_period"] = f"{year}-{pp_num:02d}"
+
+    # Transform
+    # ---------
+    # Sum overtime/double and premium hours all into overtime_hrs
+    hours_df["overtime_hrs"] = (
+        hours_df["DBLTME - DOUBLETIME"] + hours_df["OT_1.5 - OVERTIME"]
+    )
 
+    # Add a new column "dept_wd_id" using dict, and drop rows without a known workday dept ID
+    hours_df["dept_wd_id"] = (
+        hours_df["Department Name"].str.lower().map(_ALIASES_LC_TO_WDID)
+    )
+    hours_df.dropna(subset=["dept_wd_id"], inplace=True)
+    # Reassign canonical dept names from workday ID using dict
+    hours_df["dept_name"] = hours_df["dept_wd_id"].map(
+        static_data.WDID_TO_DEPT_NAME
+    )
 
-def _add_pay_period_start_date(df):
+    # Rename and specific relevant columns to retain
+    hours_df.rename(
+        columns={
+            "Regular Hours": "reg_hrs",
+            "Total Productive Hours": "prod_hrs",
+            "Total Non-Productive Hours": "nonprod_hrs",
+            "Total Productive/Non-Productive Hours": "total_hrs",
+            "Total FTE": "total_fte",
+        },
+        inplace=True,
+    )
+    return hours_df[
+        [
+            "pay_period",
+            "dept_wd_id",
+            "dept_name",
+            "reg_hrs",
+            "overtime_hrs",
+            "prod_hrs",
+            "nonprod_hrs",
+            "total_hrs",
+            "total_fte",
+        ]
+    ]
+
+
+def add_pay_period_start_date(df):
     """
     Return a dataframe that adds a start_date column that translates the pay_period column
     into the first day of the pay period
@@ -473,35 +572,24 @@ def _add_pay_period_start_date(df):
             cur_date += timedelta(days=14)
             pay_period += 1
 
-    # Make a copy of the data that includes a start_date column
-    df = df.copy()
+    # Add the start_date column. Under pandas copy-on-write this does not mutate
+    # the caller's frame, so no defensive copy is needed.
     df["start_date"] = df["pay_period"].map(pay_period_to_start_date)
     return df
 
 
 def _find_start_date_of_first_pay_period_in_year(year):
-    # The pay date for a pay period, which starts on Sunday, is the Friday following the end of the pay period.
-    # Pay date = end date + 7 days = start date + 13 days + 7 days
-    def calc_pay_date(start_date):
-        return start_date + timedelta(days=20)
-
-    # If needed, walk back from anchor date by 2 weeks increments until the pay period pay date is in a prior year to target year.
-    # PAY_PERIOD_ANCHOR_DATE["start_date"] is the start date of pay period #1 in the year PAY_PERIOD_ANCHOR_DATE["year"].
-    # It is likely in Dec of the previous year.
-    cur_date = PAY_PERIOD_ANCHOR_DATE["start_date"]
-    if year < PAY_PERIOD_ANCHOR_DATE["year"]:
-        while year <= calc_pay_date(cur_date).year:
-            cur_date += timedelta(days=-14)
-
-    # The first pay period is the first pay day within a year. A pay period's pay date is 1 week past the end of the period.
-    # For example, pay 2023 PP#1 has dates of 12/17/22-12/30/22 with a pay date of 1/6/23. Since 1/6/23 is the first pay date
-    # in 2023, it is pay period #1.
-    #
-    # Walk forward from the anchor start_date 14 days at a time. Once the pay date (end date + 7 days = 20 days from start date)
-    # is in the target year, we have the dates for the first pay period.
+    # The first pay period is the one with the first pay day within a year. A pay period's
+    # pay date is the Friday following the end of the period: end date + 7 days = start
+    # date + 13 days + 7 days. For example, 2023 PP#1 has dates of 12/17/22-12/30/22 with
+    # a pay date of 1/6/23. Since 1/6/23 is the first pay date in 2023, it is pay period #1.
     #
-    while cur_date.year <= year:
-        pay_date = calc_pay_date(cur_date)
-        if pay_date.year == year:
-            return cur_date
-        cur_date += timedelta(days=14)
+    # Rather than walking from the anchor date two weeks at a time, compute directly how
+    # many whole pay periods lie between the anchor's pay date and Jan 1 of the target
+    # year: the first pay period is the earliest one whose pay date lands on or after it.
+    anchor_pay_date = PAY_PERIOD_ANCHOR_DATE["start_date"] + timedelta(days=20)
+    days_to_new_year = (datetime(year, 1, 1) - anchor_pay_date).days
+    periods_from_anchor = -(-days_to_new_year // 14)  # ceiling division
+    return PAY_PERIOD_ANCHOR_DATE["start_date"] + timedelta(
+        days=14 * periods_from_anchor
+    )
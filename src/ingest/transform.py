@@ -1,60 +1,50 @@
-import calendar
 import pandas as pd
-from datetime import timedelta
 
 
 def transform_hours_from_pay_periods_to_months(hours_df: pd.DataFrame):
     """
-    Translates hours data from pay periods in the format to the equivalent values by months
+    Translates hours data from pay periods in the format to the equivalent values by months.
+    Each biweekly pay period is split proportionally between the one or two months it
+    spans using vectorized column arithmetic rather than per-row iteration.
     """
-
-    # Map the rows in the per-pay-period data to per-month rows
-    data = {}
-    for _idx, df_row in hours_df.iterrows():
-        start_date = df_row["start_date"]
-        end_date = start_date + timedelta(days=13)
-
-        # Calculate the fraction of the pay period in the start_date month
-        # monthrange() returns weekday of first day of the month and number of days in month
-        days_in_start_month = calendar.monthrange(start_date.year, start_date.month)[1]
-        fraction = min(1.0, (days_in_start_month - start_date.day + 1) / 14)
-
-        # Add values from data columns to the current row with index: (dept ID, month)
-        _copy_fraction_of_hours_row(df_row, data, start_date, fraction)
-
-        # If the end month is different, then do the same thing with the rest of the pay period
-        if start_date.month != end_date.month:
-            _copy_fraction_of_hours_row(df_row, data, end_date, 1 - fraction)
-
-    ret = pd.DataFrame(data).T
-    return ret.reset_index(drop=True)
-
-def _copy_fraction_of_hours_row(df_row, data, date, fraction):
-    """
-    Copy column values from a data frame row, df_row, to a dict, data.
-    Values are multiplied by factor, which represents the part of the original data
-    that belongs to a particular year and month (specified by date).
-    """
-    month = f"{date.year:04d}-{date.month:02d}"
-    row_id = f"{df_row['dept_wd_id']}; {month}"
-    data[row_id] = data.get(row_id, {})
-    data_row = data[row_id]
-    data_row["month"] = month
-    data_row["dept_wd_id"] = df_row["dept_wd_id"]
-    data_row["dept_name"] = df_row["dept_name"]
-    for col in [
-        "reg_hrs",
-        "overtime_hrs",
-        "prod_hrs",
-        "nonprod_hrs",
-        "total_hrs",
-    ]:
-        # Multiply the pay period value by portion of the period in this month
-        data_row[col] = data_row.get(col, 0) + df_row[col] * fraction
-
-    # FTE has to be recalculated using a conversion factor of (14 days / days in month),
-    # because the FTE depends on the total hours / number of total days
-    days_in_month = calendar.monthrange(date.year, date.month)[1]
-    data_row["total_fte"] = data_row.get("total_fte", 0) + df_row[
-        "total_fte"
-    ] * fraction * (14 / days_in_month)
+    hour_cols = ["reg_hrs", "overtime_hrs", "prod_hrs", "nonprod_hrs", "total_hrs"]
+
+    start_date = pd.to_datetime(hours_df["start_date"])
+    end_date = start_date + pd.Timedelta(days=13)
+
+    # Calculate the fraction of each pay period in the start_date month
+    days_in_start_month = start_date.dt.days_in_month
+    fraction = ((days_in_start_month - start_date.dt.day + 1) / 14).clip(upper=1.0)
+
+    # Build one frame attributing each period's hours to the month containing
+    # start_date, and a second frame with the remainder for the periods that
+    # cross into the following month
+    parts = []
+    for date, frac in ((start_date, fraction), (end_date, 1 - fraction)):
+        part = pd.DataFrame(
+            {
+                "month": date.dt.strftime("%Y-%m"),
+                "dept_wd_id": hours_df["dept_wd_id"],
+                "dept_name": hours_df["dept_name"],
+            }
+        )
+        for col in hour_cols:
+            # Multiply the pay period value by portion of the period in this month
+            part[col] = hours_df[col] * frac
+
+        # FTE has to be recalculated using a conversion factor of (14 days / days in month),
+        # because the FTE depends on the total hours / number of total days
+        part["total_fte"] = hours_df["total_fte"] * frac * (14 / date.dt.days_in_month)
+        parts.append(part)
+
+    # Keep remainder rows only for pay periods that actually span two months
+    parts[1] = parts[1][start_date.dt.month != end_date.dt.month]
+
+    # Sum the contributions to each month per department. observed=True so a
+    # categorical dept_wd_id only yields groups that actually occur, not the
+    # full category x month product (the default on pandas < 3).
+    df = pd.concat(parts, ignore_index=True)
+    ret = df.groupby(["dept_wd_id", "month"], as_index=False, observed=True).agg(
+        {"dept_name": "first", **{col: "sum" for col in hour_cols}, "total_fte": "sum"}
+    )
+    return ret[["month", "dept_wd_id", "dept_name"] + hour_cols + ["total_fte"]]
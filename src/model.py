@@ -17,6 +17,7 @@ class SourceMetadata(Base):
     id = mapped_column(Integer, primary_key=True)
     filename = mapped_column(String, nullable=False)
     modified = mapped_column(DateTime, nullable=False)
+    sha256 = mapped_column(String(64), nullable=True)
 
 
 class Volume(Base):
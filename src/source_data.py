@@ -45,6 +45,11 @@ class SourceData:
     sources_updated: dict = field(default_factory=dict)
     contracted_hours_updated_month: str = None
 
+    # (min, max) YYYY-MM months to offer in the UI, precomputed once per load.
+    # An eager field rather than a cached property so it survives st.cache_data's
+    # pickling of from_db's return value.
+    month_range: tuple = None
+
 
 @st.cache_data(show_spinner=False)
 def from_db(db_file: str) -> SourceData:
@@ -65,8 +70,13 @@ def from_db(db_file: str) -> SourceData:
             "contracted_hours_updated_month": session.query(
                 Metadata.contracted_hours_updated_month
             ).scalar(),
+            # Select just the columns needed, so reading still works against a
+            # DB written before newer columns (eg. sha256) were added
             "sources_updated": {
-                row.filename: row.modified for row in session.query(SourceMetadata)
+                row.filename: row.modified
+                for row in session.query(
+                    SourceMetadata.filename, SourceMetadata.modified
+                )
             },
         }
 
@@ -80,8 +90,33 @@ def from_db(db_file: str) -> SourceData:
         "income_stmt_df": pd.read_sql_table(IncomeStmt.__tablename__, engine),
     }
 
+    # Dictionary-encode the heavily repeated department ID strings so the
+    # per-department filters in each dept page hash small integer codes instead
+    # of strings. The month column stays a plain string: it is compared against
+    # arbitrary YYYY-MM values that may not appear in the data, which ordered
+    # categoricals reject.
+    for df in dfs.values():
+        if "dept_wd_id" in df.columns:
+            df["dept_wd_id"] = df["dept_wd_id"].astype("category")
+
+    # Precompute the month range shown in the sidebar so reruns don't rescan the
+    # month columns. The upper bound is the latest month with data in every
+    # table, hence min() over the maxes.
+    month_range = (
+        min(
+            dfs["volumes_df"]["month"].min(),
+            dfs["hours_df"]["month"].min(),
+            dfs["income_stmt_df"]["month"].min(),
+        ),
+        min(
+            dfs["volumes_df"]["month"].max(),
+            dfs["hours_df"]["month"].max(),
+            dfs["income_stmt_df"]["month"].max(),
+        ),
+    )
+
     engine.dispose()
-    return SourceData(**metadata, **dfs)
+    return SourceData(month_range=month_range, **metadata, **dfs)
 
 
 def fetch_source_file_to_disk(file, url, key, force=False):
@@ -5,9 +5,11 @@ Utility functions
 import calendar
 import typing
 import streamlit as st
+import numpy as np
 import pandas as pd
 import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 from dateutil.relativedelta import relativedelta
 from openpyxl.utils import cell
 from . import static_data
@@ -194,18 +196,18 @@ def df_next_row(
     """
     # Convert the columns from Excel A1-notation to column indices
     column_indices = _cols_A1_to_idx_list(columns)
+    if df.shape[0] <= start_row_idx or df.shape[1] == 0:
+        return -1
 
-    # Iterate over the rows starting from the specified row
-    for row in range(start_row_idx, df.shape[0]):
-        row_data = df.iloc[row, column_indices]
-        if (not find_empty and not row_data.isnull().all()) or (
-            find_empty and row_data.isnull().all()
-        ):
-            # Return index of either first non-empty or empty row, depending on find_empty parameter
-            return row
+    # Find the first non-empty (or empty) row with one vectorized scan over the
+    # selected columns instead of testing row by row
+    has_data = (
+        df.iloc[start_row_idx:, column_indices].notna().any(axis=1).to_numpy()
+    )
+    matches = np.flatnonzero(has_data != find_empty)
 
-    # Return -1 if no empty row is found
-    return -1
+    # Return -1 if no matching row is found
+    return start_row_idx + int(matches[0]) if len(matches) > 0 else -1
 
 
 def df_next_empty_row(df: pd.DataFrame, columns: str, start_row_idx: int = 0) -> int:
@@ -226,17 +228,18 @@ def df_next_col(
     """
     # Convert the rows from Excel A1-notation to row indices
     row_indices = _rows_A1_to_idx_list(rows)
+    if df.shape[1] <= start_col_idx or df.shape[0] == 0:
+        return -1
 
-    # Iterate over the columns starting from the specified column
-    for col in range(start_col_idx, df.shape[1]):
-        col_data = df.iloc[row_indices, col]
-        if (not find_empty and not col_data.isnull().all()) or (
-            find_empty and col_data.isnull().all()
-        ):
-            return col
+    # Find the first non-empty (or empty) column with one vectorized scan over the
+    # selected rows instead of testing column by column
+    has_data = (
+        df.iloc[row_indices, start_col_idx:].notna().any(axis=0).to_numpy()
+    )
+    matches = np.flatnonzero(has_data != find_empty)
 
-    # Return -1 if no non-empty column is found
-    return -1
+    # Return -1 if no matching column is found
+    return start_col_idx + int(matches[0]) if len(matches) > 0 else -1
 
 
 def df_next_empty_col(df: pd.DataFrame, rows: str, start_col_idx: int = 0) -> int:
@@ -413,12 +416,14 @@ def split_YYYY_MM(date_str):
         return pd.NA, pd.NA
 
 
+@lru_cache(maxsize=256)
 def YYYY_MM_to_month_str(date_str):
     """
-    Convert a month string in the format "2023-01" to a month string in the format "Jan 2023"
+    Convert a month string in the format "2023-01" to a month string in the format "Jan 2023".
+    Cached, since the same handful of months are reformatted on every rerun.
     """
     year, month = split_YYYY_MM(date_str)
-    return f"{datetime(year, month, 1):%b %Y}"
+    return f"{calendar.month_abbr[month]} {year}"
 
 def last_day_of_month(month_str: str) -> datetime:
     """